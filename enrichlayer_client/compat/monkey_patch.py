@@ -7,48 +7,89 @@ package to use EnrichLayer backend instead of the original Proxycurl backend.
 
 from __future__ import annotations
 
-import asyncio
+import builtins
 import functools
+import importlib
+import inspect
 import os
 import sys
+import types
 from typing import Any, Optional
 import warnings
 
 # Supported concurrency variants
 VARIANTS = ["asyncio", "gevent", "twisted"]
 
+# proxycurl-py module for each variant, in VARIANTS order
+_PROXYCURL_MODULES = tuple(f"proxycurl.{variant}" for variant in VARIANTS)
+
 # Module-level mappings populated at import time
 AVAILABLE_PROXYCURL_VARIANTS = {}
 AVAILABLE_ENRICHLAYER_VARIANTS = {}
-EXCEPTION_CLASS_MAPPING = {}
+_EXCEPTION_CLASS_MAPPING = {}
+
+# Read-only view of the exception mapping; only this module may add entries
+EXCEPTION_CLASS_MAPPING = types.MappingProxyType(_EXCEPTION_CLASS_MAPPING)
+
+# EnrichLayerException classes of the available enrichlayer variants
+_ENRICHLAYER_EXCEPTIONS: tuple[type[Exception], ...] = ()
+
+# ProxycurlException classes of the available proxycurl variants
+_PROXYCURL_EXCEPTIONS: tuple[type[Exception], ...] = ()
+
+# Raised exception class -> ProxycurlException class, seeded at import time
+_EXC_MAP: dict[type[Exception], type[Exception]] = {}
+
+# deprecation_warnings setting of the active patches, None while disabled
+_enabled_with: Optional[bool] = None
+
+# builtins.__import__ as it was before _setup_import_hooks() replaced it
+_original_import: Any = None
+
+
+def _cached_import(module_name: str, item_name: str) -> Any:
+    """Return an attribute of a module, importing the module only if needed"""
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return getattr(modules[module_name], item_name)
 
 
 def _initialize_variants():
     """Initialize all variant mappings once at module import time"""
+    global _ENRICHLAYER_EXCEPTIONS, _PROXYCURL_EXCEPTIONS
+
+    enrichlayer_exceptions = []
     for variant in VARIANTS:
         # Check proxycurl variant availability
         try:
-            proxycurl_module = __import__(
-                f"proxycurl.{variant}.base", fromlist=["ProxycurlException"]
+            proxycurl_exception = _cached_import(
+                f"proxycurl.{variant}.base", "ProxycurlException"
             )
-            AVAILABLE_PROXYCURL_VARIANTS[variant] = proxycurl_module.ProxycurlException
         except ImportError:
-            pass
+            proxycurl_exception = None
+        else:
+            AVAILABLE_PROXYCURL_VARIANTS[variant] = proxycurl_exception
+            _EXCEPTION_CLASS_MAPPING[f"enrichlayer_client.{variant}"] = (
+                proxycurl_exception
+            )
 
         # Check enrichlayer variant availability
         try:
-            enrichlayer_module = __import__(
-                f"enrichlayer_client.{variant}", fromlist=["EnrichLayer"]
+            AVAILABLE_ENRICHLAYER_VARIANTS[variant] = _cached_import(
+                f"enrichlayer_client.{variant}", "EnrichLayer"
+            )
+            enrichlayer_exception = _cached_import(
+                f"enrichlayer_client.{variant}.base", "EnrichLayerException"
             )
-            AVAILABLE_ENRICHLAYER_VARIANTS[variant] = enrichlayer_module.EnrichLayer
         except ImportError:
-            pass
+            continue
+        enrichlayer_exceptions.append(enrichlayer_exception)
+        if proxycurl_exception is not None:
+            _EXC_MAP[enrichlayer_exception] = proxycurl_exception
 
-        # Build exception mapping for available variants
-        if variant in AVAILABLE_PROXYCURL_VARIANTS:
-            EXCEPTION_CLASS_MAPPING[
-                f"enrichlayer_client.{variant}"
-            ] = AVAILABLE_PROXYCURL_VARIANTS[variant]
+    _ENRICHLAYER_EXCEPTIONS = tuple(enrichlayer_exceptions)
+    _PROXYCURL_EXCEPTIONS = tuple(AVAILABLE_PROXYCURL_VARIANTS.values())
 
 
 def _verify_proxycurl_available():
@@ -66,6 +107,24 @@ _initialize_variants()
 _verify_proxycurl_available()
 
 
+def _get_proxycurl_exception(exception: Exception) -> type[Exception]:
+    """Get the appropriate ProxycurlException class for the given enrichlayer exception"""
+    exception_type = type(exception)
+    for cls in exception_type.__mro__:
+        proxycurl_exception_class = _EXC_MAP.get(cls)
+        if proxycurl_exception_class is not None:
+            _EXC_MAP[exception_type] = proxycurl_exception_class
+            return proxycurl_exception_class
+
+    # No mapping found - raise original exception
+    raise exception
+
+
+def _is_enrichlayer_exception(exception: Exception) -> bool:
+    """Check if the exception is an EnrichLayerException using actual class comparison"""
+    return isinstance(exception, _ENRICHLAYER_EXCEPTIONS)
+
+
 def error_mapping_decorator(func: Any) -> Any:
     """
     Decorator that catches EnrichLayerException and re-raises as ProxycurlException.
@@ -73,77 +132,51 @@ def error_mapping_decorator(func: Any) -> Any:
     This ensures that users of the compatibility layer see proxycurl-style errors
     instead of enrichlayer-specific errors.
 
-    Uses module-level EXCEPTION_CLASS_MAPPING for consistent, static mapping.
+    Exact EnrichLayerException classes are looked up in the module-level _EXC_MAP;
+    subclasses go through the MRO once and are cached.
+    Whether func is async is decided here, so only the matching wrapper is built.
     """
+    if inspect.iscoroutinefunction(func):
 
-    def get_proxycurl_exception(exception: Exception):
-        """Get the appropriate ProxycurlException class for the given enrichlayer exception"""
-        module = getattr(exception.__class__, "__module__", "")
-
-        # Find matching mapping by checking if module contains the key
-        for (
-            enrichlayer_module,
-            proxycurl_exception_class,
-        ) in EXCEPTION_CLASS_MAPPING.items():
-            if enrichlayer_module in module:
-                return proxycurl_exception_class
-
-        # No mapping found - raise original exception
-        raise exception
-
-    def is_enrichlayer_exception(exception: Exception) -> bool:
-        """Check if the exception is an EnrichLayerException using actual class comparison"""
-        # Get all available EnrichLayerException classes from initialized variants
-        enrichlayer_exceptions = []
-
-        for variant in AVAILABLE_ENRICHLAYER_VARIANTS:
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
             try:
-                enrichlayer_module = __import__(
-                    f"enrichlayer_client.{variant}.base",
-                    fromlist=["EnrichLayerException"],
-                )
-                enrichlayer_exceptions.append(enrichlayer_module.EnrichLayerException)
-            except (ImportError, AttributeError):
-                pass
-
-        # Check if exception is instance of any EnrichLayerException
-        return any(
-            isinstance(exception, exc_class) for exc_class in enrichlayer_exceptions
-        )
-
-    @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            if is_enrichlayer_exception(e):
-                # Get the appropriate ProxycurlException class based on the enrichlayer variant
-                ProxycurlExceptionClass = get_proxycurl_exception(e)
+                return await func(*args, **kwargs)
+            except _PROXYCURL_EXCEPTIONS:
+                # Already mapped by an inner decorated call
+                raise
+            except Exception as e:
+                ProxycurlExceptionClass = _EXC_MAP.get(type(e))
+                if ProxycurlExceptionClass is None:
+                    if not _is_enrichlayer_exception(e):
+                        # Re-raise other exceptions unchanged
+                        raise
+                    # Get the appropriate ProxycurlException class based on the enrichlayer variant
+                    ProxycurlExceptionClass = _get_proxycurl_exception(e)
                 # Re-raise as ProxycurlException with the same message and context
                 raise ProxycurlExceptionClass(str(e)) from e
-            else:
-                # Re-raise other exceptions unchanged
-                raise
+
+        return async_wrapper
 
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except _PROXYCURL_EXCEPTIONS:
+            # Already mapped by an inner decorated call
+            raise
         except Exception as e:
-            if is_enrichlayer_exception(e):
+            ProxycurlExceptionClass = _EXC_MAP.get(type(e))
+            if ProxycurlExceptionClass is None:
+                if not _is_enrichlayer_exception(e):
+                    # Re-raise other exceptions unchanged
+                    raise
                 # Get the appropriate ProxycurlException class based on the enrichlayer variant
-                ProxycurlExceptionClass = get_proxycurl_exception(e)
-                # Re-raise as ProxycurlException with the same message and context
-                raise ProxycurlExceptionClass(str(e)) from e
-            else:
-                # Re-raise other exceptions unchanged
-                raise
+                ProxycurlExceptionClass = _get_proxycurl_exception(e)
+            # Re-raise as ProxycurlException with the same message and context
+            raise ProxycurlExceptionClass(str(e)) from e
 
-    # Return appropriate wrapper based on whether the function is async
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
-    else:
-        return sync_wrapper
+    return sync_wrapper
 
 
 class ErrorMappingWrapper:
@@ -154,6 +187,8 @@ class ErrorMappingWrapper:
     error mapping from EnrichLayerException to ProxycurlException.
     """
 
+    __slots__ = ("_wrapped",)
+
     def __init__(self, wrapped_object: Any) -> None:
         self._wrapped = wrapped_object
 
@@ -164,46 +199,41 @@ class ErrorMappingWrapper:
         return attr
 
 
+# enrichlayer namespaces exposed under proxycurl's linkedin.* interface
+_LINKEDIN_NAMESPACES = ("person", "company", "school", "job", "customers")
+
+
 class LinkedinCompatibilityWrapper:
     """
     Wrapper that provides the linkedin.* interface for compatibility.
 
     Maps the old proxycurl.linkedin.* structure to the new enrichlayer direct access.
+    person, company, school, job and customers give access to the matching
+    enrichlayer namespace with error mapping. Each is wrapped on first access
+    and then kept in its slot.
     """
 
+    __slots__ = ("_enrichlayer", *_LINKEDIN_NAMESPACES)
+
     def __init__(self, enrichlayer_instance: Any) -> None:
         self._enrichlayer = enrichlayer_instance
 
-    @property
-    def person(self) -> Any:
-        """Provides access to person methods via enrichlayer.person with error mapping"""
-        return ErrorMappingWrapper(self._enrichlayer.person)
-
-    @property
-    def company(self) -> Any:
-        """Provides access to company methods via enrichlayer.company with error mapping"""
-        return ErrorMappingWrapper(self._enrichlayer.company)
-
-    @property
-    def school(self) -> Any:
-        """Provides access to school methods via enrichlayer.school with error mapping"""
-        return ErrorMappingWrapper(self._enrichlayer.school)
-
-    @property
-    def job(self) -> Any:
-        """Provides access to job methods via enrichlayer.job with error mapping"""
-        return ErrorMappingWrapper(self._enrichlayer.job)
-
-    @property
-    def customers(self) -> Any:
-        """Provides access to customers methods via enrichlayer.customers with error mapping"""
-        return ErrorMappingWrapper(self._enrichlayer.customers)
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while a namespace slot is still empty
+        if name not in _LINKEDIN_NAMESPACES:
+            raise AttributeError(name)
+        wrapper = ErrorMappingWrapper(getattr(self._enrichlayer, name))
+        setattr(self, name, wrapper)
+        return wrapper
 
 
+@functools.cache
 def create_proxycurl_wrapper_class(enrichlayer_class: type[Any]) -> type[Any]:
     """
     Creates a Proxycurl wrapper class that uses EnrichLayer backend.
 
+    The class is built once per EnrichLayer class and reused on later calls.
+
     Args:
         enrichlayer_class: The EnrichLayer class to wrap (AsyncIO, Gevent, or Twisted)
 
@@ -264,8 +294,11 @@ def create_proxycurl_wrapper_class(enrichlayer_class: type[Any]) -> type[Any]:
 
 def _patch_all_variants(show_warnings: bool = False) -> None:
     """Patch all available enrichlayer variants"""
-    for variant, enrichlayer_class in AVAILABLE_ENRICHLAYER_VARIANTS.items():
-        patch_proxycurl_module(f"proxycurl.{variant}", enrichlayer_class, show_warnings)
+    available = AVAILABLE_ENRICHLAYER_VARIANTS
+    for variant, module_name in zip(VARIANTS, _PROXYCURL_MODULES):
+        enrichlayer_class = available.get(variant)
+        if enrichlayer_class is not None:
+            patch_proxycurl_module(module_name, enrichlayer_class, show_warnings)
 
 
 def patch_proxycurl_module(
@@ -280,12 +313,11 @@ def patch_proxycurl_module(
         show_warnings: Whether to show deprecation warnings
     """
 
-    if module_name not in sys.modules:
+    module = sys.modules.get(module_name)
+    if module is None:
         # Module not imported yet, nothing to patch
         return
 
-    module = sys.modules[module_name]
-
     if not hasattr(module, "Proxycurl"):
         # Module doesn't have Proxycurl class, nothing to patch
         return
@@ -308,6 +340,7 @@ def patch_proxycurl_module(
 
 def enable_proxycurl_compatibility(
     deprecation_warnings: bool = False,
+    force: bool = False,
 ) -> None:
     """
     Enable proxycurl-py compatibility by monkey patching existing proxycurl modules.
@@ -319,6 +352,7 @@ def enable_proxycurl_compatibility(
 
     Args:
         deprecation_warnings: Whether to show warnings about deprecated proxycurl usage
+        force: Re-apply the patches even if they were already applied
 
     Example:
         import enrichlayer_client.compat as enrichlayer
@@ -332,14 +366,23 @@ def enable_proxycurl_compatibility(
     Note:
         This function should be called before importing any proxycurl modules.
         API keys should be passed to the Proxycurl constructor as normal.
+        Calls with the deprecation_warnings setting already in effect are
+        no-ops unless force is True.
     """
 
+    global _enabled_with
+
+    if _enabled_with == deprecation_warnings and not force:
+        return
+
     # Patch all available enrichlayer variants
     _patch_all_variants(deprecation_warnings)
 
     # Set up import hooks for future imports
     _setup_import_hooks(deprecation_warnings)
 
+    _enabled_with = deprecation_warnings
+
 
 def _setup_import_hooks(show_warnings: bool = False) -> None:
     """
@@ -349,12 +392,12 @@ def _setup_import_hooks(show_warnings: bool = False) -> None:
     enable_proxycurl_compatibility(), they will still be patched.
     """
 
-    # Store original __import__ to call later
-    original_import = (
-        __builtins__["__import__"]
-        if isinstance(__builtins__, dict)
-        else __builtins__.__import__
-    )
+    global _original_import
+
+    # Keep the __import__ we replace, so repeated calls wrap it only once
+    if _original_import is None:
+        _original_import = builtins.__import__
+    original_import = _original_import
 
     def patching_import(name, globals=None, locals=None, fromlist=(), level=0):
         """Custom import function that patches proxycurl modules after they're imported."""
@@ -375,10 +418,7 @@ def _setup_import_hooks(show_warnings: bool = False) -> None:
         return module
 
     # Replace the built-in __import__ function
-    if isinstance(__builtins__, dict):
-        __builtins__["__import__"] = patching_import
-    else:
-        __builtins__.__import__ = patching_import
+    builtins.__import__ = patching_import
 
 
 def disable_proxycurl_compatibility():
@@ -388,15 +428,20 @@ def disable_proxycurl_compatibility():
     This function restores the original Proxycurl classes in all loaded
     proxycurl modules, effectively disabling the EnrichLayer backend.
     """
+    global _enabled_with, _original_import
+
+    for module_name in _PROXYCURL_MODULES:
+        module = sys.modules.get(module_name)
+        if module is not None and hasattr(module, "_original_Proxycurl"):
+            module.Proxycurl = module._original_Proxycurl
+            delattr(module, "_original_Proxycurl")
 
-    modules_to_restore = ["proxycurl.asyncio", "proxycurl.gevent", "proxycurl.twisted"]
+    _enabled_with = None
 
-    for module_name in modules_to_restore:
-        if module_name in sys.modules:
-            module = sys.modules[module_name]
-            if hasattr(module, "_original_Proxycurl"):
-                module.Proxycurl = module._original_Proxycurl
-                delattr(module, "_original_Proxycurl")
+    # Put back the original __import__
+    if _original_import is not None:
+        builtins.__import__ = _original_import
+        _original_import = None
 
     # Remove import hooks
     sys.meta_path = [
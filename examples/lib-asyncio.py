@@ -6,22 +6,21 @@ from enrichlayer_client.asyncio import EnrichLayer, do_bulk
 enrichlayer = EnrichLayer()
 
 
-balance = asyncio.run(enrichlayer.get_balance())
-
-print("Balance:", balance)
-
-person = asyncio.run(
-    enrichlayer.person.get(
-        linkedin_profile_url="https://sg.linkedin.com/in/williamhgates"
+async def fetch_independent():
+    # Independent calls run concurrently, so this takes as long as the slowest
+    return await asyncio.gather(
+        enrichlayer.get_balance(),
+        enrichlayer.person.get(
+            linkedin_profile_url="https://sg.linkedin.com/in/williamhgates"
+        ),
+        enrichlayer.company.get(url="https://www.linkedin.com/company/apple"),
     )
-)
 
-print("Person Result:", person)
 
-company = asyncio.run(
-    enrichlayer.company.get(url="https://www.linkedin.com/company/apple")
-)
+balance, person, company = asyncio.run(fetch_independent())
 
+print("Balance:", balance)
+print("Person Result:", person)
 print("Company Result:", company)
 
 # PROCESS BULK WITH CSV
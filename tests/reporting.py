@@ -0,0 +1,23 @@
+"""
+Report helpers shared by the endpoint test modules.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON serializer
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize the report as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def new_counts() -> dict:
+    """Fresh total/success/error counters for one report group."""
+    return {"total": 0, "success": 0, "error": 0}
@@ -5,22 +5,57 @@ These tests verify that the monkey patching functionality works correctly
 and that existing proxycurl-py code can work with EnrichLayer backend.
 """
 
+import importlib
 import sys
+from types import SimpleNamespace
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+from enrichlayer_client.compat.monkey_patch import _PROXYCURL_MODULES
 
 
 class TestProxycurlCompatibility(unittest.TestCase):
     """Test proxycurl compatibility functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import proxycurl modules once and remember their original classes."""
+        cls._proxycurl_saved = {}
+        for module_name in _PROXYCURL_MODULES:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            cls._proxycurl_saved[module] = getattr(
+                module, "_original_Proxycurl", module.Proxycurl
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._restore_proxycurl()
+
+    @classmethod
+    def _restore_proxycurl(cls):
+        """Put back the original Proxycurl classes and drop patch markers."""
+        for module, proxycurl_class in cls._proxycurl_saved.items():
+            module.Proxycurl = proxycurl_class
+            module.__dict__.pop("_original_Proxycurl", None)
+
     def setUp(self):
         """Set up test environment."""
-        # Clear any existing proxycurl modules from cache
-        modules_to_clear = [
-            name for name in sys.modules.keys() if name.startswith("proxycurl")
-        ]
-        for module_name in modules_to_clear:
-            del sys.modules[module_name]
+        # Undo any patching left behind by earlier tests
+        self._restore_proxycurl()
+        self._reset_enabled()
+
+    def tearDown(self):
+        self._reset_enabled()
+
+    @staticmethod
+    def _reset_enabled():
+        """Forget previous enable_proxycurl_compatibility() calls."""
+        from enrichlayer_client.compat import monkey_patch
+
+        monkey_patch._enabled_with = None
 
     def test_enable_compatibility_function_exists(self):
         """Test that enable_proxycurl_compatibility function is accessible."""
@@ -42,6 +77,9 @@ class TestProxycurlCompatibility(unittest.TestCase):
         # Verify it's a class and can be instantiated
         self.assertTrue(isinstance(WrapperClass, type))
 
+        # Repeated calls reuse the same class
+        self.assertIs(create_proxycurl_wrapper_class(EnrichLayer), WrapperClass)
+
         # Create mock instance to avoid real API calls
         with patch.object(EnrichLayer, "__init__", return_value=None):
             instance = WrapperClass()
@@ -51,32 +89,22 @@ class TestProxycurlCompatibility(unittest.TestCase):
         """Test that LinkedinCompatibilityWrapper provides the right interface."""
         from enrichlayer_client.compat.monkey_patch import LinkedinCompatibilityWrapper
 
-        # Create mock enrichlayer instance
-        mock_enrichlayer = Mock()
-        mock_enrichlayer.person = Mock()
-        mock_enrichlayer.company = Mock()
-        mock_enrichlayer.school = Mock()
-        mock_enrichlayer.job = Mock()
-        mock_enrichlayer.customers = Mock()
+        # Create stand-in enrichlayer instance
+        mock_enrichlayer = SimpleNamespace(
+            person=object(),
+            company=object(),
+            school=object(),
+            job=object(),
+            customers=object(),
+        )
 
         # Create wrapper
         linkedin_wrapper = LinkedinCompatibilityWrapper(mock_enrichlayer)
 
-        # Verify all expected properties exist
-        self.assertTrue(hasattr(linkedin_wrapper, "person"))
-        self.assertTrue(hasattr(linkedin_wrapper, "company"))
-        self.assertTrue(hasattr(linkedin_wrapper, "school"))
-        self.assertTrue(hasattr(linkedin_wrapper, "job"))
-        self.assertTrue(hasattr(linkedin_wrapper, "customers"))
-
         # Verify they delegate correctly through ErrorMappingWrapper
-        self.assertEqual(linkedin_wrapper.person._wrapped, mock_enrichlayer.person)
-        self.assertEqual(linkedin_wrapper.company._wrapped, mock_enrichlayer.company)
-        self.assertEqual(linkedin_wrapper.school._wrapped, mock_enrichlayer.school)
-        self.assertEqual(linkedin_wrapper.job._wrapped, mock_enrichlayer.job)
-        self.assertEqual(
-            linkedin_wrapper.customers._wrapped, mock_enrichlayer.customers
-        )
+        expected = vars(mock_enrichlayer)
+        actual = {name: getattr(linkedin_wrapper, name)._wrapped for name in expected}
+        self.assertDictEqual(actual, expected)
 
     def test_environment_variable_handling(self):
         """Test that PROXYCURL_API_KEY is handled correctly."""
@@ -105,7 +133,7 @@ class TestProxycurlCompatibility(unittest.TestCase):
         # Create a simple class to act as the mock module
         class MockModule:
             def __init__(self):
-                self.Proxycurl = Mock()
+                self.Proxycurl = object()
                 self.__name__ = "test.module"
 
         mock_module = MockModule()
@@ -145,6 +173,65 @@ class TestProxycurlCompatibility(unittest.TestCase):
             mock_patch_all.assert_called_once_with(True)
             mock_setup_hooks.assert_called_once_with(True)
 
+            # A second call with the same arguments is a no-op
+            enrichlayer.enable_proxycurl_compatibility(deprecation_warnings=True)
+            mock_patch_all.assert_called_once_with(True)
+            mock_setup_hooks.assert_called_once_with(True)
+
+            # force re-applies the patches
+            enrichlayer.enable_proxycurl_compatibility(
+                deprecation_warnings=True, force=True
+            )
+            self.assertEqual(mock_patch_all.call_count, 2)
+            self.assertEqual(mock_setup_hooks.call_count, 2)
+
+    def test_enable_compatibility_switches_warning_setting(self):
+        """Test that switching deprecation_warnings back re-applies the patches."""
+        import enrichlayer_client.compat as enrichlayer
+
+        with patch(
+            "enrichlayer_client.compat.monkey_patch._patch_all_variants"
+        ) as mock_patch_all, patch(
+            "enrichlayer_client.compat.monkey_patch._setup_import_hooks"
+        ) as mock_setup_hooks:
+            for deprecation_warnings in (True, False, True):
+                enrichlayer.enable_proxycurl_compatibility(
+                    deprecation_warnings=deprecation_warnings
+                )
+
+            # Each call changes the active setting, so none is a no-op
+            expected = [((True,),), ((False,),), ((True,),)]
+            self.assertEqual(mock_patch_all.call_args_list, expected)
+            self.assertEqual(mock_setup_hooks.call_args_list, expected)
+
+    def test_import_hook_reinstalled_over_original(self):
+        """Test that force does not stack import hooks and disable removes them."""
+        import builtins
+
+        from enrichlayer_client.compat import monkey_patch
+
+        saved = (builtins.__import__, monkey_patch._original_import)
+        self.addCleanup(setattr, builtins, "__import__", saved[0])
+        self.addCleanup(setattr, monkey_patch, "_original_import", saved[1])
+
+        # Start from the unhooked __import__
+        original_import = saved[1] or saved[0]
+        builtins.__import__ = original_import
+        monkey_patch._original_import = None
+
+        monkey_patch.enable_proxycurl_compatibility(force=True)
+        first_hook = builtins.__import__
+        self.assertIsNot(first_hook, original_import)
+
+        # A forced second call replaces the hook on top of the original
+        monkey_patch.enable_proxycurl_compatibility(force=True)
+        self.assertIsNot(builtins.__import__, first_hook)
+        self.assertIs(monkey_patch._original_import, original_import)
+
+        monkey_patch.disable_proxycurl_compatibility()
+        self.assertIs(builtins.__import__, original_import)
+        self.assertIsNone(monkey_patch._original_import)
+
 
 if __name__ == "__main__":
     unittest.main()
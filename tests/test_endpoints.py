@@ -9,19 +9,273 @@ Tests ALL 25 endpoints across 4 client types with equal coverage:
 - Proxycurl Compatibility (synchronous)
 
 Ensures feature parity and performance comparison across all paradigms.
+
+Set ENRICHLAYER_TEST_SAMPLES=1 to include sample response data in the report.
 """
 
 import asyncio
+from collections import Counter, defaultdict
+from contextlib import suppress
 from datetime import datetime
-import json
+from functools import cache
+import importlib
+from itertools import islice
 import os
 import sys
 import time
-from typing import Any
+from typing import Any, Optional
 import unittest
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from enrichlayer_client.asyncio import do_bulk as asyncio_do_bulk  # noqa: E402
+from enrichlayer_client.config import MAX_RETRIES, MAX_WORKERS, TIMEOUT  # noqa: E402
+from tests.reporting import dumps, new_counts  # noqa: E402
+
+try:
+    from enrichlayer_client.gevent import do_bulk
+except ImportError:  # gevent extra not installed
+    do_bulk = None
+
+try:
+    import crochet
+except ImportError:  # needed to drive the twisted reactor from a test
+    crochet = None
+
+try:
+    import uvloop
+except ImportError:  # optional faster event loop
+    uvloop = None
+
+try:
+    from enrichlayer_client.compat import enable_proxycurl_compatibility
+except ImportError:  # proxycurl-py not installed
+    enable_proxycurl_compatibility = None
+
+# Whether to extract sample response data into the report
+SAMPLES = os.environ.get("ENRICHLAYER_TEST_SAMPLES") == "1"
+
+
+@cache
+def _client(variant: str, api_key: str):
+    """Return a shared EnrichLayer client for the given variant and API key."""
+    module = importlib.import_module(f"enrichlayer_client.{variant}")
+    return module.EnrichLayer(api_key=api_key)
+
+
+@cache
+def _proxycurl_client(api_key: str):
+    """Return a shared Proxycurl compatibility client for the given API key."""
+    enable_proxycurl_compatibility()
+
+    from proxycurl.gevent import Proxycurl
+
+    return Proxycurl(api_key=api_key)
+
+
+def _sample_balance(result: dict) -> dict:
+    return {"credit_balance": result.get("credit_balance")}
+
+
+def _sample_person(result: dict) -> dict:
+    headline = result.get("headline")
+    return {
+        "full_name": result.get("full_name"),
+        "headline": headline[:50] + "..." if headline else None,
+        "experience_count": len(result.get("experiences", [])),
+        "education_count": len(result.get("education", [])),
+    }
+
+
+def _sample_company(result: dict) -> dict:
+    return {
+        "name": result.get("name"),
+        "industry": result.get("industry"),
+        "follower_count": result.get("follower_count"),
+    }
+
+
+def _sample_school(result: dict) -> dict:
+    return {"name": result.get("name"), "industry": result.get("industry")}
+
+
+def _sample_job(result: dict) -> dict:
+    return {"title": result.get("title"), "company": result.get("company")}
+
+
+def _sample_generic(result: dict) -> dict:
+    return dict(islice(result.items(), 3))
+
+
+def _endpoint_category(endpoint: str) -> str:
+    """Report category for an endpoint name such as "person.get"."""
+    head, sep, tail = endpoint.partition(".")
+    if not sep:
+        return "general"
+    if head == "linkedin":
+        return "linkedin_compat"
+    if head in ("gevent", "asyncio", "twisted"):
+        return tail.partition(".")[0]
+    return head
+
+
+# Fixed skeleton of the human-readable summary written by tearDownClass
+_SUMMARY_TMPL = """\
+EQUAL COVERAGE ENDPOINT TEST RESULTS
+{sep}
+Generated: {generated}
+{sep}
+
+📊 OVERALL SUMMARY
+{rule30}
+Total Tests: {total}
+Successful: {successful}
+Failed: {failed}
+Success Rate: {success_rate:.1f}%
+Total Credits Used: {credits}
+Duration: {duration:.2f}s
+
+🎯 COVERAGE BY CLIENT TYPE
+{rule40}
+{coverage_lines}
+📈 ENDPOINT COVERAGE EQUALITY
+{rule40}
+{equality_lines}
+🎆 EQUAL COVERAGE ACHIEVED
+{rule40}
+All 4 client types now test the same comprehensive endpoint set:
+  • Gevent: {expected} endpoints
+  • Asyncio: {expected} endpoints
+  • Twisted: {expected} endpoints
+  • Proxycurl: {expected} endpoints
+
+✅ SUCCESSFUL ENDPOINTS
+{rule30}
+{successful_lines}
+{failed_section}"""
+
+# Test URLs and data
+TEST_DATA = {
+    "person_url": "https://www.linkedin.com/in/williamhgates/",
+    "company_url": "https://www.linkedin.com/company/apple",
+    "school_url": "https://www.linkedin.com/school/national-university-of-singapore/",
+    "job_url": "https://www.linkedin.com/jobs/view/3586148395",
+    "test_email": "bill@microsoft.com",
+    "test_phone": "+1234567890",
+}
+
+# ALL endpoints as (method path, keyword arguments, expected credits)
+ENDPOINTS = (
+    # General endpoints
+    ("get_balance", {}, 0),
+    # Person endpoints (9 total)
+    (
+        "person.get",
+        {"linkedin_profile_url": TEST_DATA["person_url"], "extra": "exclude"},
+        1,
+    ),
+    (
+        "person.search",
+        {
+            "country": "US",
+            "first_name": "John",
+            "last_name": "Smith",
+            "enrich_profiles": "skip",
+        },
+        10,
+    ),
+    (
+        "person.resolve",
+        {"company_domain": "microsoft.com", "first_name": "Bill", "last_name": "Gates"},
+        2,
+    ),
+    (
+        "person.resolve_by_email",
+        {"email": TEST_DATA["test_email"], "lookup_depth": "deep"},
+        1,
+    ),
+    ("person.resolve_by_phone", {"phone_number": TEST_DATA["test_phone"]}, 1),
+    ("person.lookup_email", {"linkedin_profile_url": TEST_DATA["person_url"]}, 1),
+    ("person.personal_contact", {"linkedin_profile_url": TEST_DATA["person_url"]}, 1),
+    ("person.personal_email", {"linkedin_profile_url": TEST_DATA["person_url"]}, 1),
+    (
+        "person.profile_picture",
+        {"linkedin_person_profile_url": TEST_DATA["person_url"]},
+        0,
+    ),
+    # Company endpoints (10 total)
+    ("company.get", {"url": TEST_DATA["company_url"]}, 1),
+    (
+        "company.search",
+        {"country": "US", "region": "California", "type": "Public Company"},
+        10,
+    ),
+    ("company.resolve", {"company_name": "Apple", "company_domain": "apple.com"}, 2),
+    ("company.find_job", {"keyword": "engineer", "geo_id": "103644278"}, 2),
+    ("company.job_count", {"keyword": "engineer", "geo_id": "103644278"}, 1),
+    ("company.employee_count", {"url": TEST_DATA["company_url"]}, 1),
+    ("company.employee_list", {"url": TEST_DATA["company_url"]}, 1),
+    (
+        "company.employee_search",
+        {
+            "keyword_regex": "CEO",
+            "linkedin_company_profile_url": TEST_DATA["company_url"],
+        },
+        3,
+    ),
+    ("company.role_lookup", {"company_name": "apple", "role": "CEO"}, 3),
+    (
+        "company.profile_picture",
+        {"linkedin_company_profile_url": TEST_DATA["company_url"]},
+        0,
+    ),
+    # School endpoints (2 total)
+    ("school.get", {"url": TEST_DATA["school_url"]}, 1),
+    ("school.student_list", {"linkedin_school_url": TEST_DATA["school_url"]}, 1),
+    # Job endpoints (1 total)
+    ("job.get", {"url": TEST_DATA["job_url"]}, 1),
+    # Customer endpoints (1 total)
+    ("customers.listing", {}, 1),
+)
+
+# The same endpoints through proxycurl's linkedin.* interface
+PROXYCURL_ENDPOINTS = tuple(
+    (
+        path if path.startswith(("get_balance", "customers.")) else f"linkedin.{path}",
+        kwargs,
+        credits,
+    )
+    for path, kwargs, credits in ENDPOINTS
+)
+
+
+# Resolved client methods keyed by (client, dotted path)
+_RESOLVED: dict = {}
+
+
+def resolve(client: Any, path: str) -> Any:
+    """Return the client method at a dotted path such as "person.get"."""
+    key = (client, path)
+    method = _RESOLVED.get(key)
+    if method is None:
+        method = client
+        for name in path.split("."):
+            method = getattr(method, name)
+        _RESOLVED[key] = method
+    return method
+
+
+# Sample-data extractors keyed by endpoint name (without the "linkedin." prefix)
+SAMPLERS = {
+    "get_balance": _sample_balance,
+    "person.get": _sample_person,
+    "company.get": _sample_company,
+    "school.get": _sample_school,
+    "job.get": _sample_job,
+}
 
 
 class TestAllEndpointsEqualCoverage(unittest.TestCase):
@@ -36,194 +290,45 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
         if not cls.api_key:
             raise unittest.SkipTest("No API key found in environment variables")
 
+        # Run the asyncio client on uvloop when it is installed
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
         cls.test_results = []
-        cls.start_time = time.time()
+        cls.start_time = time.perf_counter()
         cls.total_credits_used = 0
 
-        # Test URLs and data
-        cls.test_data = {
-            "person_url": "https://www.linkedin.com/in/williamhgates/",
-            "company_url": "https://www.linkedin.com/company/apple",
-            "school_url": "https://www.linkedin.com/school/national-university-of-singapore/",
-            "job_url": "https://www.linkedin.com/jobs/view/3586148395",
-            "test_email": "bill@microsoft.com",
-            "test_phone": "+1234567890",
-        }
+        # Running aggregates, updated by _record_result as results come in
+        cls.by_client_type = defaultdict(new_counts)
+        cls.by_category = defaultdict(new_counts)
+        cls.by_status = Counter()
+        cls.total_result_duration = 0.0
 
-        # Define ALL endpoints with expected credits for comprehensive testing
-        cls.all_endpoints = [
-            # General endpoints
-            ("get_balance", lambda client: client.get_balance(), 0),
-            # Person endpoints (9 total)
-            (
-                "person.get",
-                lambda client: client.person.get(
-                    linkedin_profile_url=cls.test_data["person_url"], extra="exclude"
-                ),
-                1,
-            ),
-            (
-                "person.search",
-                lambda client: client.person.search(
-                    country="US",
-                    first_name="John",
-                    last_name="Smith",
-                    enrich_profiles="skip",
-                ),
-                10,
-            ),
-            (
-                "person.resolve",
-                lambda client: client.person.resolve(
-                    company_domain="microsoft.com", first_name="Bill", last_name="Gates"
-                ),
-                2,
-            ),
-            (
-                "person.resolve_by_email",
-                lambda client: client.person.resolve_by_email(
-                    email=cls.test_data["test_email"], lookup_depth="deep"
-                ),
-                1,
-            ),
-            (
-                "person.resolve_by_phone",
-                lambda client: client.person.resolve_by_phone(
-                    phone_number=cls.test_data["test_phone"]
-                ),
-                1,
-            ),
-            (
-                "person.lookup_email",
-                lambda client: client.person.lookup_email(
-                    linkedin_profile_url=cls.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "person.personal_contact",
-                lambda client: client.person.personal_contact(
-                    linkedin_profile_url=cls.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "person.personal_email",
-                lambda client: client.person.personal_email(
-                    linkedin_profile_url=cls.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "person.profile_picture",
-                lambda client: client.person.profile_picture(
-                    linkedin_person_profile_url=cls.test_data["person_url"]
-                ),
-                0,
-            ),
-            # Company endpoints (10 total)
-            (
-                "company.get",
-                lambda client: client.company.get(url=cls.test_data["company_url"]),
-                1,
-            ),
-            (
-                "company.search",
-                lambda client: client.company.search(
-                    country="US", region="California", type="Public Company"
-                ),
-                10,
-            ),
-            (
-                "company.resolve",
-                lambda client: client.company.resolve(
-                    company_name="Apple", company_domain="apple.com"
-                ),
-                2,
-            ),
-            (
-                "company.find_job",
-                lambda client: client.company.find_job(
-                    keyword="engineer", geo_id="103644278"
-                ),
-                2,
-            ),
-            (
-                "company.job_count",
-                lambda client: client.company.job_count(
-                    keyword="engineer", geo_id="103644278"
-                ),
-                1,
-            ),
-            (
-                "company.employee_count",
-                lambda client: client.company.employee_count(
-                    url=cls.test_data["company_url"]
-                ),
-                1,
-            ),
-            (
-                "company.employee_list",
-                lambda client: client.company.employee_list(
-                    url=cls.test_data["company_url"]
-                ),
-                1,
-            ),
-            (
-                "company.employee_search",
-                lambda client: client.company.employee_search(
-                    keyword_regex="CEO",
-                    linkedin_company_profile_url=cls.test_data["company_url"],
-                ),
-                3,
-            ),
-            (
-                "company.role_lookup",
-                lambda client: client.company.role_lookup(
-                    company_name="apple", role="CEO"
-                ),
-                3,
-            ),
-            (
-                "company.profile_picture",
-                lambda client: client.company.profile_picture(
-                    linkedin_company_profile_url=cls.test_data["company_url"]
-                ),
-                0,
-            ),
-            # School endpoints (2 total)
-            (
-                "school.get",
-                lambda client: client.school.get(url=cls.test_data["school_url"]),
-                1,
-            ),
-            (
-                "school.student_list",
-                lambda client: client.school.student_list(
-                    linkedin_school_url=cls.test_data["school_url"]
-                ),
-                1,
-            ),
-            # Job endpoints (1 total)
-            ("job.get", lambda client: client.job.get(url=cls.test_data["job_url"]), 1),
-            # Customer endpoints (1 total)
-            ("customers.listing", lambda client: client.customers.listing(), 1),
-        ]
+        # Build each client once so every test shares its connection setup
+        cls.clients = {}
+        for variant in ("gevent", "asyncio", "twisted"):
+            with suppress(ImportError):
+                cls.clients[variant] = _client(variant, cls.api_key)
+        if enable_proxycurl_compatibility is not None:
+            cls.clients["proxycurl"] = _proxycurl_client(cls.api_key)
+
+        cls.test_data = TEST_DATA
+        cls.all_endpoints = ENDPOINTS
 
     def setUp(self):
         """Set up for each test."""
-        self.test_start_time = time.time()
+        self.test_start_time = time.perf_counter()
 
     def tearDown(self):
         """Clean up after each test."""
-        self.test_duration = time.time() - self.test_start_time
+        self.test_duration = time.perf_counter() - self.test_start_time
 
     def _get_test_duration(self):
         """Get test duration, handling cases where tearDown hasn't run."""
         if hasattr(self, "test_duration"):
             return self.test_duration
         return (
-            time.time() - self.test_start_time
+            time.perf_counter() - self.test_start_time
             if hasattr(self, "test_start_time")
             else 0
         )
@@ -236,15 +341,23 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
         credits_used: int = 0,
         error: str = None,
         sample_data: Any = None,
+        duration: Optional[float] = None,
     ):
-        """Record test result for reporting."""
+        """Record test result for reporting.
+
+        duration is the time of the call itself; without it the time since
+        the test started is used.
+        """
+        if duration is None:
+            duration = self._get_test_duration()
         result = {
             "endpoint": endpoint,
             "client_type": client_type,
             "status": status,
-            "duration": round(self._get_test_duration(), 3),
+            "duration": round(duration, 3),
             "credits_used": credits_used,
-            "timestamp": datetime.now().isoformat(),
+            # Raw nanoseconds; converted to ISO format once, in tearDownClass
+            "timestamp": time.time_ns(),
         }
 
         if error:
@@ -252,92 +365,100 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
         if sample_data:
             result["sample_data"] = sample_data
 
-        self.test_results.append(result)
-        self.__class__.total_credits_used += credits_used
+        cls = self.__class__
+        cls.test_results.append(result)
+        cls.total_credits_used += credits_used
+        cls.total_result_duration += result["duration"]
+        cls.by_status[status] += 1
+        for counts in (
+            cls.by_client_type[client_type],
+            cls.by_category[_endpoint_category(endpoint)],
+        ):
+            counts["total"] += 1
+            counts[status] += 1
 
     def _extract_sample_data(self, endpoint_name: str, result: Any) -> dict:
         """Extract relevant sample data from API response."""
-        sample_data = {}
-
-        if isinstance(result, dict):
-            if endpoint_name == "get_balance":
-                sample_data = {"credit_balance": result.get("credit_balance")}
-            elif "person.get" in endpoint_name:
-                sample_data = {
-                    "full_name": result.get("full_name"),
-                    "headline": result.get("headline", "")[:50] + "..."
-                    if result.get("headline")
-                    else None,
-                    "experience_count": len(result.get("experiences", [])),
-                    "education_count": len(result.get("education", [])),
-                }
-            elif "company.get" in endpoint_name:
-                sample_data = {
-                    "name": result.get("name"),
-                    "industry": result.get("industry"),
-                    "follower_count": result.get("follower_count"),
-                }
-            elif "school.get" in endpoint_name:
-                sample_data = {
-                    "name": result.get("name"),
-                    "industry": result.get("industry"),
-                }
-            elif "job.get" in endpoint_name:
-                sample_data = {
-                    "title": result.get("title"),
-                    "company": result.get("company"),
-                }
-            else:
-                # Generic sample for other endpoints
-                sample_data = (
-                    {k: v for k, v in list(result.items())[:3]} if result else {}
-                )
-
-        return sample_data
-
-    def _test_all_endpoints(self, client, client_type: str, endpoint_prefix: str = ""):
-        """Test all endpoints with given client."""
-        for endpoint_name, endpoint_func, expected_credits in self.all_endpoints:
-            full_endpoint_name = (
-                f"{endpoint_prefix}{endpoint_name}"
-                if endpoint_prefix
-                else endpoint_name
-            )
-
-            with self.subTest(endpoint=full_endpoint_name, client=client_type):
+        if not SAMPLES or not isinstance(result, dict):
+            return {}
+
+        endpoint_name = endpoint_name.removeprefix("linkedin.")
+        return SAMPLERS.get(endpoint_name, _sample_generic)(result)
+
+    def _get_client(self, client_type: str):
+        """Return the shared client for client_type, skipping if unavailable."""
+        client = self.clients.get(client_type)
+        if client is None:
+            self.skipTest(f"{client_type} client is not available")
+        return client
+
+    def _record_outcomes(self, endpoints, outcomes, client_type: str):
+        """Record (result, error, duration) outcomes in the same order as endpoints."""
+        for (endpoint_name, _, expected_credits), (result, error, duration) in zip(
+            endpoints, outcomes
+        ):
+            with self.subTest(endpoint=endpoint_name, client=client_type):
                 try:
-                    result = endpoint_func(client)
+                    if error is not None:
+                        raise error
                     self.assertIsNotNone(result)
 
                     # Extract sample data
                     sample_data = self._extract_sample_data(endpoint_name, result)
 
                     self._record_result(
-                        full_endpoint_name,
+                        endpoint_name,
                         client_type,
                         "success",
                         expected_credits,
                         sample_data=sample_data,
+                        duration=duration,
                     )
 
                 except Exception as e:
                     self._record_result(
-                        full_endpoint_name, client_type, "error", 0, str(e)
+                        endpoint_name,
+                        client_type,
+                        "error",
+                        0,
+                        str(e),
+                        duration=duration,
                     )
                     print(f"⚠️  {client_type} {endpoint_name} failed: {e}")
 
+    def _test_all_endpoints(self, client, client_type: str, concurrency: int = 1):
+        """Test all endpoints with given client, up to concurrency calls at once."""
+        endpoints = self.all_endpoints
+
+        def call(endpoint):
+            path, kwargs, _ = endpoint
+            start = time.perf_counter()
+            try:
+                result = resolve(client, path)(**kwargs)
+            except Exception as e:
+                return None, e, time.perf_counter() - start
+            return result, None, time.perf_counter() - start
+
+        if concurrency > 1:
+            from gevent.pool import Pool
+
+            outcomes = Pool(concurrency).imap(call, endpoints)
+        else:
+            outcomes = map(call, endpoints)
+
+        self._record_outcomes(endpoints, outcomes, client_type)
+
     # ======================
     # GEVENT CLIENT TESTS
     # ======================
 
     def test_gevent_all_endpoints(self):
         """Test ALL 25 endpoints with gevent client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self._get_client("gevent")
 
         print(f"\n🔄 Testing GEVENT client with {len(self.all_endpoints)} endpoints...")
-        self._test_all_endpoints(client, "gevent")
+        # The endpoints are independent; run them on greenlets, capped like do_bulk
+        self._test_all_endpoints(client, "gevent", concurrency=MAX_WORKERS)
 
     # ======================
     # ASYNCIO CLIENT TESTS
@@ -345,44 +466,33 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
     def test_asyncio_all_endpoints(self):
         """Test ALL 25 endpoints with asyncio client."""
-        from enrichlayer_client.asyncio import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self._get_client("asyncio")
 
         print(
             f"\n⚡ Testing ASYNCIO client with {len(self.all_endpoints)} endpoints..."
         )
 
-        # Create async versions of endpoints
-        async_endpoints = []
-        for endpoint_name, endpoint_func, expected_credits in self.all_endpoints:
-
-            def make_async_func(func):
-                return lambda client: asyncio.run(func(client))
-
-            async_func = make_async_func(endpoint_func)
-            async_endpoints.append((endpoint_name, async_func, expected_credits))
-
-        for endpoint_name, endpoint_func, expected_credits in async_endpoints:
-            with self.subTest(endpoint=endpoint_name, client="asyncio"):
-                try:
-                    result = endpoint_func(client)
-                    self.assertIsNotNone(result)
-
-                    # Extract sample data
-                    sample_data = self._extract_sample_data(endpoint_name, result)
-
-                    self._record_result(
-                        endpoint_name,
-                        "asyncio",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
+        async def run_all():
+            # Cap in-flight requests like do_bulk does, to stay clear of rate limits
+            semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+            async def bounded(path, kwargs):
+                async with semaphore:
+                    # Timed once a slot is free, so waiting is not counted
+                    start = time.perf_counter()
+                    try:
+                        result = await resolve(client, path)(**kwargs)
+                    except Exception as e:
+                        return None, e, time.perf_counter() - start
+                    return result, None, time.perf_counter() - start
+
+            return await asyncio.gather(
+                *(bounded(path, kwargs) for path, kwargs, _ in self.all_endpoints)
+            )
 
-                except Exception as e:
-                    self._record_result(endpoint_name, "asyncio", "error", 0, str(e))
-                    print(f"⚠️  asyncio {endpoint_name} failed: {e}")
+        # One event loop for the whole batch instead of one per endpoint
+        outcomes = asyncio.run(run_all())
+        self._record_outcomes(self.all_endpoints, outcomes, "asyncio")
 
     # ======================
     # TWISTED CLIENT TESTS
@@ -390,46 +500,43 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
     def test_twisted_all_endpoints(self):
         """Test ALL 25 endpoints with twisted client."""
-        from enrichlayer_client.twisted import EnrichLayer
+        client = self._get_client("twisted")
 
-        client = EnrichLayer(api_key=self.api_key)
+        if crochet is None:
+            self.skipTest("crochet is required to run the twisted reactor")
+        crochet.setup()
 
         print(
             f"\n🌀 Testing TWISTED client with {len(self.all_endpoints)} endpoints..."
         )
 
-        # Test ALL endpoints - twisted client should handle deferreds internally
-        for endpoint_name, endpoint_func, expected_credits in self.all_endpoints:
-            with self.subTest(endpoint=endpoint_name, client="twisted"):
-                try:
-                    # Twisted client should return results synchronously in this context
-                    result = endpoint_func(client)
-
-                    # Handle deferred objects if returned
-                    if hasattr(result, "result"):
-                        # If it's a deferred that has already fired
-                        try:
-                            result = result.result()
-                        except Exception:
-                            # If deferred hasn't fired, consider it successful for now
-                            result = {"twisted_deferred": "pending"}
+        from twisted.internet import defer
 
-                    self.assertIsNotNone(result)
+        endpoints = self.all_endpoints
+        # Each wave of up to MAX_WORKERS calls may use every retry
+        waves = -(-len(endpoints) // MAX_WORKERS)
 
-                    # Extract sample data
-                    sample_data = self._extract_sample_data(endpoint_name, result)
-
-                    self._record_result(
-                        endpoint_name,
-                        "twisted",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
+        def timed(path, kwargs):
+            # Runs once the semaphore is acquired, so waiting is not counted
+            start = time.perf_counter()
+            d = defer.maybeDeferred(resolve(client, path), **kwargs)
+            d.addCallbacks(
+                lambda result: (result, None, time.perf_counter() - start),
+                lambda failure: (None, failure.value, time.perf_counter() - start),
+            )
+            return d
+
+        @crochet.wait_for(timeout=TIMEOUT * MAX_RETRIES * waves)
+        def run_all():
+            semaphore = defer.DeferredSemaphore(MAX_WORKERS)
+            return defer.DeferredList(
+                [semaphore.run(timed, path, kwargs) for path, kwargs, _ in endpoints],
+                consumeErrors=True,
+            )
 
-                except Exception as e:
-                    self._record_result(endpoint_name, "twisted", "error", 0, str(e))
-                    print(f"⚠️  twisted {endpoint_name} failed: {e}")
+        # Block on the real results instead of treating unfired deferreds as passes
+        outcomes = (outcome for _, outcome in run_all())
+        self._record_outcomes(endpoints, outcomes, "twisted")
 
     # ======================
     # PROXYCURL COMPATIBILITY TESTS
@@ -437,191 +544,18 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
     def test_proxycurl_all_endpoints(self):
         """Test ALL 25 endpoints with proxycurl compatibility layer."""
-        # Enable compatibility
-        from enrichlayer_client.compat import enable_proxycurl_compatibility
-
-        enable_proxycurl_compatibility(api_key=self.api_key)
-
-        from proxycurl.gevent import Proxycurl
-
-        proxycurl = Proxycurl(api_key=self.api_key)
+        proxycurl = self._get_client("proxycurl")
 
         print(
             f"\n🔄 Testing PROXYCURL compatibility with {len(self.all_endpoints)} endpoints..."
         )
 
-        # Map ALL endpoints to proxycurl interface - complete coverage
-        proxycurl_endpoints = [
-            # General
-            ("get_balance", lambda client: client.get_balance(), 0),
-            # Person endpoints (9 total)
-            (
-                "linkedin.person.get",
-                lambda client: client.linkedin.person.get(
-                    linkedin_profile_url=self.test_data["person_url"], extra="exclude"
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.search",
-                lambda client: client.linkedin.person.search(
-                    country="US",
-                    first_name="John",
-                    last_name="Smith",
-                    enrich_profiles="skip",
-                ),
-                10,
-            ),
-            (
-                "linkedin.person.resolve",
-                lambda client: client.linkedin.person.resolve(
-                    company_domain="microsoft.com", first_name="Bill", last_name="Gates"
-                ),
-                2,
-            ),
-            (
-                "linkedin.person.resolve_by_email",
-                lambda client: client.linkedin.person.resolve_by_email(
-                    email=self.test_data["test_email"], lookup_depth="deep"
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.resolve_by_phone",
-                lambda client: client.linkedin.person.resolve_by_phone(
-                    phone_number=self.test_data["test_phone"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.lookup_email",
-                lambda client: client.linkedin.person.lookup_email(
-                    linkedin_profile_url=self.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.personal_contact",
-                lambda client: client.linkedin.person.personal_contact(
-                    linkedin_profile_url=self.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.personal_email",
-                lambda client: client.linkedin.person.personal_email(
-                    linkedin_profile_url=self.test_data["person_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.person.profile_picture",
-                lambda client: client.linkedin.person.profile_picture(
-                    linkedin_person_profile_url=self.test_data["person_url"]
-                ),
-                0,
-            ),
-            # Company endpoints (10 total)
-            (
-                "linkedin.company.get",
-                lambda client: client.linkedin.company.get(
-                    url=self.test_data["company_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.company.search",
-                lambda client: client.linkedin.company.search(
-                    country="US", region="California", type="Public Company"
-                ),
-                10,
-            ),
-            (
-                "linkedin.company.resolve",
-                lambda client: client.linkedin.company.resolve(
-                    company_name="Apple", company_domain="apple.com"
-                ),
-                2,
-            ),
-            (
-                "linkedin.company.find_job",
-                lambda client: client.linkedin.company.find_job(
-                    keyword="engineer", geo_id="103644278"
-                ),
-                2,
-            ),
-            (
-                "linkedin.company.job_count",
-                lambda client: client.linkedin.company.job_count(
-                    keyword="engineer", geo_id="103644278"
-                ),
-                1,
-            ),
-            (
-                "linkedin.company.employee_count",
-                lambda client: client.linkedin.company.employee_count(
-                    url=self.test_data["company_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.company.employee_list",
-                lambda client: client.linkedin.company.employee_list(
-                    url=self.test_data["company_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.company.employee_search",
-                lambda client: client.linkedin.company.employee_search(
-                    keyword_regex="CEO",
-                    linkedin_company_profile_url=self.test_data["company_url"],
-                ),
-                3,
-            ),
-            (
-                "linkedin.company.role_lookup",
-                lambda client: client.linkedin.company.role_lookup(
-                    company_name="apple", role="CEO"
-                ),
-                3,
-            ),
-            (
-                "linkedin.company.profile_picture",
-                lambda client: client.linkedin.company.profile_picture(
-                    linkedin_company_profile_url=self.test_data["company_url"]
-                ),
-                0,
-            ),
-            # School endpoints (2 total)
-            (
-                "linkedin.school.get",
-                lambda client: client.linkedin.school.get(
-                    url=self.test_data["school_url"]
-                ),
-                1,
-            ),
-            (
-                "linkedin.school.student_list",
-                lambda client: client.linkedin.school.student_list(
-                    linkedin_school_url=self.test_data["school_url"]
-                ),
-                1,
-            ),
-            # Job endpoints (1 total)
-            (
-                "linkedin.job.get",
-                lambda client: client.linkedin.job.get(url=self.test_data["job_url"]),
-                1,
-            ),
-            # Customer endpoints (1 total)
-            ("customers.listing", lambda client: client.customers.listing(), 1),
-        ]
-
-        for endpoint_name, endpoint_func, expected_credits in proxycurl_endpoints:
+        for endpoint_name, kwargs, expected_credits in PROXYCURL_ENDPOINTS:
             with self.subTest(endpoint=endpoint_name, client="proxycurl"):
+                start = time.perf_counter()
                 try:
-                    result = endpoint_func(proxycurl)
+                    result = resolve(proxycurl, endpoint_name)(**kwargs)
+                    duration = time.perf_counter() - start
                     self.assertIsNotNone(result)
 
                     # Extract sample data
@@ -633,10 +567,18 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
                         "success",
                         expected_credits,
                         sample_data=sample_data,
+                        duration=duration,
                     )
 
                 except Exception as e:
-                    self._record_result(endpoint_name, "proxycurl", "error", 0, str(e))
+                    self._record_result(
+                        endpoint_name,
+                        "proxycurl",
+                        "error",
+                        0,
+                        str(e),
+                        duration=time.perf_counter() - start,
+                    )
                     print(f"⚠️  proxycurl {endpoint_name} failed: {e}")
 
     # ======================
@@ -648,9 +590,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
         # Test gevent bulk
         try:
-            from enrichlayer_client.gevent import EnrichLayer, do_bulk
-
-            client = EnrichLayer(api_key=self.api_key)
+            client = self.clients["gevent"]
 
             bulk_operations = [
                 (
@@ -666,7 +606,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
             sample_data = {
                 "total_operations": len(bulk_operations),
-                "successful_results": len([r for r in result if r.success]),
+                "successful_results": sum(1 for r in result if r.success),
                 "client_type": "gevent",
             }
 
@@ -680,10 +620,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
         # Test asyncio bulk
         try:
-            from enrichlayer_client.asyncio import EnrichLayer as AsyncioEnrichLayer
-            from enrichlayer_client.asyncio import do_bulk as asyncio_do_bulk
-
-            asyncio_client = AsyncioEnrichLayer(api_key=self.api_key)
+            asyncio_client = self.clients["asyncio"]
 
             async_bulk_operations = [
                 (
@@ -699,7 +636,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
             sample_data = {
                 "total_operations": len(async_bulk_operations),
-                "successful_results": len([r for r in result if r.success]),
+                "successful_results": sum(1 for r in result if r.success),
                 "client_type": "asyncio",
             }
 
@@ -714,44 +651,19 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Generate comprehensive test report after all tests complete."""
-        total_duration = time.time() - cls.start_time
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(None)
 
-        # Categorize results by client type
-        by_client_type = {}
-        by_status = {}
-        by_category = {}
+        total_duration = time.perf_counter() - cls.start_time
+        now = datetime.now()
 
         for result in cls.test_results:
-            client_type = result["client_type"]
-            status = result["status"]
-            endpoint = result["endpoint"]
-
-            # By client type
-            if client_type not in by_client_type:
-                by_client_type[client_type] = {"total": 0, "success": 0, "error": 0}
-            by_client_type[client_type]["total"] += 1
-            by_client_type[client_type][status] += 1
-
-            # By status
-            if status not in by_status:
-                by_status[status] = 0
-            by_status[status] += 1
-
-            # By category
-            if "." in endpoint:
-                if endpoint.startswith("linkedin."):
-                    category = "linkedin_compat"
-                elif endpoint.startswith(("gevent.", "asyncio.", "twisted.")):
-                    category = endpoint.split(".")[1]
-                else:
-                    category = endpoint.split(".")[0]
-            else:
-                category = "general"
-
-            if category not in by_category:
-                by_category[category] = {"total": 0, "success": 0, "error": 0}
-            by_category[category]["total"] += 1
-            by_category[category][status] += 1
+            result["timestamp"] = datetime.fromtimestamp(
+                result["timestamp"] / 1e9
+            ).isoformat()
+
+        by_client_type = cls.by_client_type
+        by_status = cls.by_status
 
         # Generate comprehensive report
         total_tests = len(cls.test_results)
@@ -761,7 +673,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
 
         report = {
             "test_summary": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "test_type": "equal_coverage_all_4_client_types",
                 "total_tests": total_tests,
                 "successful_tests": successful_tests,
@@ -770,7 +682,7 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
                 "total_credits_used": cls.total_credits_used,
                 "total_duration": round(total_duration, 3),
                 "average_response_time": round(
-                    sum(r["duration"] for r in cls.test_results) / total_tests, 3
+                    cls.total_result_duration / total_tests, 3
                 )
                 if total_tests > 0
                 else 0,
@@ -778,105 +690,90 @@ class TestAllEndpointsEqualCoverage(unittest.TestCase):
                 "endpoints_per_client": len(cls.all_endpoints),
             },
             "coverage_by_client_type": by_client_type,
-            "by_category": by_category,
+            "by_category": cls.by_category,
             "detailed_results": cls.test_results,
         }
 
-        # Save detailed JSON report
-        with open("tests/equal_coverage_test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
-
-        # Save human-readable summary
-        with open("tests/equal_coverage_summary.txt", "w") as f:
-            f.write("EQUAL COVERAGE ENDPOINT TEST RESULTS\n")
-            f.write("=" * 70 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 70 + "\n\n")
-
-            f.write("📊 OVERALL SUMMARY\n")
-            f.write("-" * 30 + "\n")
-            f.write(f"Total Tests: {total_tests}\n")
-            f.write(f"Successful: {successful_tests}\n")
-            f.write(f"Failed: {failed_tests}\n")
-            f.write(f"Success Rate: {success_rate:.1f}%\n")
-            f.write(f"Total Credits Used: {cls.total_credits_used}\n")
-            f.write(f"Duration: {total_duration:.2f}s\n\n")
-
-            f.write("🎯 COVERAGE BY CLIENT TYPE\n")
-            f.write("-" * 40 + "\n")
-            for client_type, stats in by_client_type.items():
-                coverage_pct = (
-                    stats["success"] / stats["total"] * 100 if stats["total"] > 0 else 0
-                )
-                f.write(
-                    f"{client_type.upper()}: {stats['success']}/{stats['total']} successful ({coverage_pct:.1f}%)\n"
-                )
-            f.write("\n")
-
-            f.write("📈 ENDPOINT COVERAGE EQUALITY\n")
-            f.write("-" * 40 + "\n")
-            expected_endpoints = len(cls.all_endpoints)
-            for client_type, stats in by_client_type.items():
-                if client_type == "proxycurl":
-                    expected = expected_endpoints  # Now covers ALL endpoints
-                else:
-                    expected = expected_endpoints
-                f.write(
-                    f"{client_type.upper()}: {stats['total']}/{expected} endpoints tested\n"
-                )
-            f.write("\n")
-
-            f.write("🎆 EQUAL COVERAGE ACHIEVED\n")
-            f.write("-" * 40 + "\n")
-            f.write(
-                "All 4 client types now test the same comprehensive endpoint set:\n"
-            )
-            f.write(f"  • Gevent: {expected_endpoints} endpoints\n")
-            f.write(f"  • Asyncio: {expected_endpoints} endpoints\n")
-            f.write(f"  • Twisted: {expected_endpoints} endpoints\n")
-            f.write(f"  • Proxycurl: {expected_endpoints} endpoints\n")
-            f.write("\n")
-
-            f.write("✅ SUCCESSFUL ENDPOINTS\n")
-            f.write("-" * 30 + "\n")
-            for result in cls.test_results:
-                if result["status"] == "success":
-                    f.write(
-                        f"  ✅ {result['endpoint']} ({result['client_type']}) - {result['credits_used']} credits, {result['duration']}s\n"
-                    )
-            f.write("\n")
-
-            if failed_tests > 0:
-                f.write("❌ FAILED ENDPOINTS\n")
-                f.write("-" * 30 + "\n")
-                for result in cls.test_results:
-                    if result["status"] == "error":
-                        f.write(
-                            f"  ❌ {result['endpoint']} ({result['client_type']}) - {result.get('error', 'Unknown error')}\n"
-                        )
-                f.write("\n")
-
-        # Print summary
-        print(f"\n{'=' * 70}")
-        print("EQUAL COVERAGE ENDPOINT TEST SUMMARY")
-        print(f"{'=' * 70}")
-        print(f"Total Tests: {total_tests}")
-        print(f"Successful: {successful_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success Rate: {success_rate:.1f}%")
-        print(f"Total Credits Used: {cls.total_credits_used}")
-        print(f"Duration: {total_duration:.2f}s")
-        print("\n🎯 COVERAGE BY CLIENT TYPE:")
+        # Build the human-readable summary
+        expected_endpoints = len(cls.all_endpoints)
+        coverage_lines = []
+        equality_lines = []
         for client_type, stats in by_client_type.items():
             coverage_pct = (
                 stats["success"] / stats["total"] * 100 if stats["total"] > 0 else 0
             )
-            print(
-                f"  {client_type.upper()}: {stats['success']}/{stats['total']} successful ({coverage_pct:.1f}%)"
+            coverage_lines.append(
+                f"{client_type.upper()}: {stats['success']}/{stats['total']} successful ({coverage_pct:.1f}%)\n"
+            )
+            equality_lines.append(
+                f"{client_type.upper()}: {stats['total']}/{expected_endpoints} endpoints tested\n"
+            )
+
+        successful_lines = "".join(
+            f"  ✅ {result['endpoint']} ({result['client_type']}) - {result['credits_used']} credits, {result['duration']}s\n"
+            for result in cls.test_results
+            if result["status"] == "success"
+        )
+
+        failed_section = ""
+        if failed_tests > 0:
+            failed_section = (
+                "❌ FAILED ENDPOINTS\n"
+                + "-" * 30
+                + "\n"
+                + "".join(
+                    f"  ❌ {result['endpoint']} ({result['client_type']}) - {result.get('error', 'Unknown error')}\n"
+                    for result in cls.test_results
+                    if result["status"] == "error"
+                )
+                + "\n"
             )
-        print("\n📁 Reports saved to:")
-        print("   • tests/equal_coverage_test_report.json")
-        print("   • tests/equal_coverage_summary.txt")
+
+        summary = _SUMMARY_TMPL.format(
+            sep="=" * 70,
+            rule30="-" * 30,
+            rule40="-" * 40,
+            generated=now.strftime("%Y-%m-%d %H:%M:%S"),
+            total=total_tests,
+            successful=successful_tests,
+            failed=failed_tests,
+            success_rate=success_rate,
+            credits=cls.total_credits_used,
+            duration=total_duration,
+            coverage_lines="".join(coverage_lines),
+            equality_lines="".join(equality_lines),
+            expected=expected_endpoints,
+            successful_lines=successful_lines,
+            failed_section=failed_section,
+        )
+
+        # Build every report payload first, then write them back-to-back
+        payloads = [
+            ("tests/equal_coverage_test_report.json", dumps(report)),
+            ("tests/equal_coverage_summary.txt", summary),
+        ]
+        for path, data in payloads:
+            with open(path, "w") as f:
+                f.write(data)
+
+        # Print summary
+        console_lines = [
+            "",
+            "=" * 70,
+            "EQUAL COVERAGE ENDPOINT TEST SUMMARY",
+            "=" * 70,
+            f"Total Tests: {total_tests}",
+            f"Successful: {successful_tests}",
+            f"Failed: {failed_tests}",
+            f"Success Rate: {success_rate:.1f}%",
+            f"Total Credits Used: {cls.total_credits_used}",
+            f"Duration: {total_duration:.2f}s",
+            "\n🎯 COVERAGE BY CLIENT TYPE:",
+        ]
+        console_lines.extend(f"  {line.rstrip()}" for line in coverage_lines)
+        console_lines.append("\n📁 Reports saved to:")
+        console_lines.extend(f"   • {path}" for path, _ in payloads)
+        print("\n".join(console_lines))
 
 
 if __name__ == "__main__":
@@ -6,8 +6,10 @@ Tests all 23 endpoints across 5 categories with both direct and compatibility in
 Based on comprehensive endpoint analysis covering person, company, school, job, and customer endpoints.
 """
 
+import asyncio
+from collections import Counter, defaultdict
 from datetime import datetime
-import json
+from itertools import islice
 import os
 import sys
 import time
@@ -15,7 +17,111 @@ from typing import Any
 import unittest
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from enrichlayer_client.asyncio import EnrichLayer as AsyncioEnrichLayer  # noqa: E402
+from enrichlayer_client.config import MAX_WORKERS  # noqa: E402
+from tests.reporting import dumps, new_counts  # noqa: E402
+
+try:
+    from gevent.pool import Pool
+
+    from enrichlayer_client.gevent import EnrichLayer, do_bulk
+except ImportError:  # gevent extra not installed
+    EnrichLayer = None
+
+try:
+    from enrichlayer_client.compat import enable_proxycurl_compatibility
+except ImportError:  # proxycurl-py not installed
+    enable_proxycurl_compatibility = None
+
+
+def _first_fields(result: Any, limit: int) -> dict:
+    """Return the first fields of a dict response, or {} for anything else."""
+    if not isinstance(result, dict):
+        return {}
+    return dict(islice(result.items(), limit))
+
+
+def _person_sample(result: dict) -> dict:
+    return {
+        "full_name": result.get("full_name"),
+        "headline": result.get("headline"),
+        "experience_count": len(result.get("experiences", [])),
+        "education_count": len(result.get("education", [])),
+    }
+
+
+def _search_sample(result: dict) -> dict:
+    return {
+        "total_results": result.get("total_result_count"),
+        "results_count": len(result.get("results", [])),
+    }
+
+
+def _person_search_sample(result: dict) -> dict:
+    return {
+        **_search_sample(result),
+        "has_next_page": result.get("next_page") is not None,
+    }
+
+
+def _profile_sample(result: dict) -> dict:
+    return {
+        "name": result.get("name"),
+        "industry": result.get("industry"),
+        "follower_count": result.get("follower_count"),
+    }
+
+
+def _job_sample(result: dict) -> dict:
+    return {"title": result.get("title"), "company": result.get("company")}
+
+
+# Sample builders for direct-client responses; other endpoints keep their
+# first three fields
+DIRECT_SAMPLES = {
+    "get_balance": lambda result: {"credit_balance": result.get("credit_balance")},
+    "person.get": _person_sample,
+    "person.search": _person_search_sample,
+    "company.get": _profile_sample,
+    "company.search": _search_sample,
+    "school.get": _profile_sample,
+    "job.get": _job_sample,
+}
+
+
+def _extract_sample(endpoint_name: str, result: Any) -> dict:
+    """Return the sample data to record for a direct-client response."""
+    if not isinstance(result, dict):
+        return {}
+    build = DIRECT_SAMPLES.get(endpoint_name)
+    if build is None:
+        return _first_fields(result, 3)
+    return build(result)
+
+
+# Skips the tests that drive the gevent client or gevent pool
+requires_gevent = unittest.skipIf(EnrichLayer is None, "gevent extra not installed")
+
+
+def _core_sample(endpoint_name: str, result: Any) -> dict:
+    """Sample for the asyncio and compatibility runs: the first two fields."""
+    return _first_fields(result, 2)
+
+
+# Endpoints reported under the "general" category
+GENERAL_ENDPOINTS = frozenset({"get_balance", "do_bulk"})
+
+
+def _endpoint_category(endpoint: str) -> str:
+    """Report category for an endpoint name such as "person.get"."""
+    head, sep, _ = endpoint.partition(".")
+    if not sep or endpoint in GENERAL_ENDPOINTS:
+        return "general"
+    return head
 
 
 class TestAllEndpoints(unittest.TestCase):
@@ -30,8 +136,25 @@ class TestAllEndpoints(unittest.TestCase):
         if not cls.api_key:
             raise unittest.SkipTest("No API key found in environment variables")
 
+        # Shared clients, built once for the whole class; the gevent client
+        # is None without the gevent extra
+        cls.client = (
+            EnrichLayer(api_key=cls.api_key) if EnrichLayer is not None else None
+        )
+        cls.asyncio_client = AsyncioEnrichLayer(api_key=cls.api_key)
+
+        # Enable compatibility once for the class
+        cls.proxycurl = None
+        if enable_proxycurl_compatibility is not None:
+            enable_proxycurl_compatibility()
+
+            # Imported after enabling, which replaces Proxycurl on the module
+            from proxycurl.asyncio import Proxycurl
+
+            cls.proxycurl = Proxycurl(api_key=cls.api_key)
+
         cls.test_results = []
-        cls.start_time = time.time()
+        cls.start_time = time.perf_counter()
         cls.total_credits_used = 0
 
         # Test URLs and data
@@ -48,18 +171,18 @@ class TestAllEndpoints(unittest.TestCase):
 
     def setUp(self):
         """Set up for each test."""
-        self.test_start_time = time.time()
+        self.test_start_time = time.perf_counter()
 
     def tearDown(self):
         """Clean up after each test."""
-        self.test_duration = time.time() - self.test_start_time
+        self.test_duration = time.perf_counter() - self.test_start_time
 
     def _get_test_duration(self):
         """Get test duration, handling cases where tearDown hasn't run."""
         if hasattr(self, "test_duration"):
             return self.test_duration
         return (
-            time.time() - self.test_start_time
+            time.perf_counter() - self.test_start_time
             if hasattr(self, "test_start_time")
             else 0
         )
@@ -80,7 +203,7 @@ class TestAllEndpoints(unittest.TestCase):
             "status": status,
             "duration": round(self._get_test_duration(), 3),
             "credits_used": credits_used,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time_ns(),
         }
 
         if error:
@@ -91,15 +214,85 @@ class TestAllEndpoints(unittest.TestCase):
         self.test_results.append(result)
         self.__class__.total_credits_used += credits_used
 
+    def _record_outcomes(
+        self,
+        tests,
+        results,
+        client_type: str,
+        sample=_extract_sample,
+        label: str = "",
+        prefix: str = "",
+    ):
+        """Record gathered results in the order of ``tests``.
+
+        Exceptions and None in ``results`` are recorded as errors. Endpoints
+        are reported as ``prefix + endpoint_name``, and ``label`` starts the
+        failure message.
+        """
+        for (endpoint_name, _, expected_credits), result in zip(tests, results):
+            endpoint = prefix + endpoint_name
+            with self.subTest(endpoint=endpoint_name, client=client_type):
+                if result is None:
+                    result = AssertionError("unexpectedly None")
+                if isinstance(result, Exception):
+                    self._record_result(endpoint, client_type, "error", 0, str(result))
+                    print(f"⚠️  {label}{endpoint_name} failed: {result}")
+                    continue
+                self._record_result(
+                    endpoint,
+                    client_type,
+                    "success",
+                    expected_credits,
+                    sample_data=sample(endpoint_name, result),
+                )
+
+    @staticmethod
+    def _gather(tests):
+        """Call every endpoint in ``tests`` on at most MAX_WORKERS greenlets.
+
+        Exceptions are returned in place of results, in the order of ``tests``.
+        """
+
+        def call(endpoint_func):
+            try:
+                return endpoint_func()
+            except Exception as e:
+                return e
+
+        return Pool(MAX_WORKERS).map(
+            call, [endpoint_func for _, endpoint_func, _ in tests]
+        )
+
+    @staticmethod
+    def _gather_async(tests):
+        """Await the endpoint coroutines in ``tests``, at most MAX_WORKERS at once.
+
+        Exceptions are returned in place of results, in the order of ``tests``.
+        """
+
+        async def gather():
+            # Created here, as the semaphore binds to the loop it is used on
+            semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+            async def bounded(endpoint_func):
+                async with semaphore:
+                    return await endpoint_func()
+
+            return await asyncio.gather(
+                *(bounded(endpoint_func) for _, endpoint_func, _ in tests),
+                return_exceptions=True,
+            )
+
+        return asyncio.run(gather())
+
     # ======================
     # DIRECT CLIENT TESTS
     # ======================
 
+    @requires_gevent
     def test_direct_general_endpoints(self):
         """Test general endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         # Test get_balance
         try:
@@ -111,17 +304,16 @@ class TestAllEndpoints(unittest.TestCase):
                 "direct",
                 "success",
                 0,
-                sample_data={"credit_balance": result.get("credit_balance")},
+                sample_data=_extract_sample("get_balance", result),
             )
         except Exception as e:
             self._record_result("get_balance", "direct", "error", 0, str(e))
             self.fail(f"get_balance failed: {e}")
 
+    @requires_gevent
     def test_direct_person_endpoints(self):
         """Test all person endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         person_tests = [
             # Core person endpoints
@@ -193,48 +385,12 @@ class TestAllEndpoints(unittest.TestCase):
             ),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in person_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    # Extract sample data based on endpoint
-                    sample_data = {}
-                    if endpoint_name == "person.get" and isinstance(result, dict):
-                        sample_data = {
-                            "full_name": result.get("full_name"),
-                            "headline": result.get("headline"),
-                            "experience_count": len(result.get("experiences", [])),
-                            "education_count": len(result.get("education", [])),
-                        }
-                    elif endpoint_name == "person.search" and isinstance(result, dict):
-                        sample_data = {
-                            "total_results": result.get("total_result_count"),
-                            "results_count": len(result.get("results", [])),
-                            "has_next_page": result.get("next_page") is not None,
-                        }
-                    elif isinstance(result, dict):
-                        # Generic sample for other endpoints
-                        sample_data = {k: v for k, v in list(result.items())[:3]}
-
-                    self._record_result(
-                        endpoint_name,
-                        "direct",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(endpoint_name, "direct", "error", 0, str(e))
-                    print(f"⚠️  {endpoint_name} failed: {e}")
+        self._record_outcomes(person_tests, self._gather(person_tests), "direct")
 
+    @requires_gevent
     def test_direct_company_endpoints(self):
         """Test all company endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         company_tests = [
             (
@@ -305,45 +461,12 @@ class TestAllEndpoints(unittest.TestCase):
             ),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in company_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    # Extract sample data
-                    sample_data = {}
-                    if endpoint_name == "company.get" and isinstance(result, dict):
-                        sample_data = {
-                            "name": result.get("name"),
-                            "industry": result.get("industry"),
-                            "follower_count": result.get("follower_count"),
-                        }
-                    elif endpoint_name == "company.search" and isinstance(result, dict):
-                        sample_data = {
-                            "total_results": result.get("total_result_count"),
-                            "results_count": len(result.get("results", [])),
-                        }
-                    elif isinstance(result, dict):
-                        sample_data = {k: v for k, v in list(result.items())[:3]}
-
-                    self._record_result(
-                        endpoint_name,
-                        "direct",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(endpoint_name, "direct", "error", 0, str(e))
-                    print(f"⚠️  {endpoint_name} failed: {e}")
+        self._record_outcomes(company_tests, self._gather(company_tests), "direct")
 
+    @requires_gevent
     def test_direct_school_endpoints(self):
         """Test all school endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         school_tests = [
             (
@@ -360,100 +483,29 @@ class TestAllEndpoints(unittest.TestCase):
             ),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in school_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    sample_data = {}
-                    if endpoint_name == "school.get" and isinstance(result, dict):
-                        sample_data = {
-                            "name": result.get("name"),
-                            "industry": result.get("industry"),
-                            "follower_count": result.get("follower_count"),
-                        }
-                    elif isinstance(result, dict):
-                        sample_data = {k: v for k, v in list(result.items())[:3]}
-
-                    self._record_result(
-                        endpoint_name,
-                        "direct",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(endpoint_name, "direct", "error", 0, str(e))
-                    print(f"⚠️  {endpoint_name} failed: {e}")
+        self._record_outcomes(school_tests, self._gather(school_tests), "direct")
 
+    @requires_gevent
     def test_direct_job_endpoints(self):
         """Test all job endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         job_tests = [
             ("job.get", lambda: client.job.get(url=self.test_data["job_url"]), 1),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in job_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    sample_data = {}
-                    if isinstance(result, dict):
-                        sample_data = {
-                            "title": result.get("title"),
-                            "company": result.get("company"),
-                        }
-
-                    self._record_result(
-                        endpoint_name,
-                        "direct",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(endpoint_name, "direct", "error", 0, str(e))
-                    print(f"⚠️  {endpoint_name} failed: {e}")
+        self._record_outcomes(job_tests, self._gather(job_tests), "direct")
 
+    @requires_gevent
     def test_direct_customer_endpoints(self):
         """Test all customer endpoints with direct client."""
-        from enrichlayer_client.gevent import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         customer_tests = [
             ("customers.listing", lambda: client.customers.listing(), 1),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in customer_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    sample_data = {}
-                    if isinstance(result, dict):
-                        sample_data = {k: v for k, v in list(result.items())[:3]}
-
-                    self._record_result(
-                        endpoint_name,
-                        "direct",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(endpoint_name, "direct", "error", 0, str(e))
-                    print(f"⚠️  {endpoint_name} failed: {e}")
+        self._record_outcomes(customer_tests, self._gather(customer_tests), "direct")
 
     # ======================
     # COMPATIBILITY TESTS
@@ -461,14 +513,9 @@ class TestAllEndpoints(unittest.TestCase):
 
     def test_compatibility_core_endpoints(self):
         """Test core endpoints through proxycurl compatibility layer."""
-        # Enable compatibility
-        from enrichlayer_client.compat import enable_proxycurl_compatibility
-
-        enable_proxycurl_compatibility(api_key=self.api_key)
-
-        from proxycurl.asyncio import Proxycurl
-
-        proxycurl = Proxycurl(api_key=self.api_key)
+        proxycurl = self.proxycurl
+        if proxycurl is None:
+            self.skipTest("proxycurl-py not installed")
 
         compatibility_tests = [
             # General
@@ -527,30 +574,13 @@ class TestAllEndpoints(unittest.TestCase):
             ),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in compatibility_tests:
-            with self.subTest(endpoint=endpoint_name):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    # Extract basic sample data
-                    sample_data = {}
-                    if isinstance(result, dict):
-                        sample_data = {k: v for k, v in list(result.items())[:2]}
-
-                    self._record_result(
-                        endpoint_name,
-                        "compatibility",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(
-                        endpoint_name, "compatibility", "error", 0, str(e)
-                    )
-                    print(f"⚠️  Compatibility {endpoint_name} failed: {e}")
+        self._record_outcomes(
+            compatibility_tests,
+            self._gather_async(compatibility_tests),
+            "compatibility",
+            sample=_core_sample,
+            label="Compatibility ",
+        )
 
     # ======================
     # ASYNCIO CLIENT TESTS
@@ -558,103 +588,72 @@ class TestAllEndpoints(unittest.TestCase):
 
     def test_asyncio_core_endpoints(self):
         """Test core endpoints with asyncio client for comparison."""
-        import asyncio
-
-        from enrichlayer_client.asyncio import EnrichLayer
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.asyncio_client
 
         asyncio_tests = [
             # General
-            ("get_balance", lambda: asyncio.run(client.get_balance()), 0),
+            ("get_balance", lambda: client.get_balance(), 0),
             # Person endpoints (sample)
             (
                 "person.get",
-                lambda: asyncio.run(
-                    client.person.get(
-                        linkedin_profile_url=self.test_data["person_url"],
-                        extra="exclude",
-                    )
+                lambda: client.person.get(
+                    linkedin_profile_url=self.test_data["person_url"],
+                    extra="exclude",
                 ),
                 1,
             ),
             (
                 "person.search",
-                lambda: asyncio.run(
-                    client.person.search(
-                        country="US",
-                        first_name="John",
-                        last_name="Smith",
-                        enrich_profiles="skip",
-                    )
+                lambda: client.person.search(
+                    country="US",
+                    first_name="John",
+                    last_name="Smith",
+                    enrich_profiles="skip",
                 ),
                 10,
             ),
             # Company endpoints (sample)
             (
                 "company.get",
-                lambda: asyncio.run(
-                    client.company.get(url=self.test_data["company_url"])
-                ),
+                lambda: client.company.get(url=self.test_data["company_url"]),
                 1,
             ),
             (
                 "company.find_job",
-                lambda: asyncio.run(
-                    client.company.find_job(keyword="engineer", geo_id="103644278")
-                ),
+                lambda: client.company.find_job(keyword="engineer", geo_id="103644278"),
                 2,
             ),
             # School endpoints
             (
                 "school.get",
-                lambda: asyncio.run(
-                    client.school.get(url=self.test_data["school_url"])
-                ),
+                lambda: client.school.get(url=self.test_data["school_url"]),
                 1,
             ),
             # Job endpoints
             (
                 "job.get",
-                lambda: asyncio.run(client.job.get(url=self.test_data["job_url"])),
+                lambda: client.job.get(url=self.test_data["job_url"]),
                 1,
             ),
         ]
 
-        for endpoint_name, endpoint_func, expected_credits in asyncio_tests:
-            with self.subTest(endpoint=endpoint_name, client="asyncio"):
-                try:
-                    result = endpoint_func()
-                    self.assertIsNotNone(result)
-
-                    # Extract basic sample data
-                    sample_data = {}
-                    if isinstance(result, dict):
-                        sample_data = {k: v for k, v in list(result.items())[:2]}
-
-                    self._record_result(
-                        f"asyncio.{endpoint_name}",
-                        "asyncio",
-                        "success",
-                        expected_credits,
-                        sample_data=sample_data,
-                    )
-
-                except Exception as e:
-                    self._record_result(
-                        f"asyncio.{endpoint_name}", "asyncio", "error", 0, str(e)
-                    )
-                    print(f"⚠️  Asyncio {endpoint_name} failed: {e}")
+        self._record_outcomes(
+            asyncio_tests,
+            self._gather_async(asyncio_tests),
+            "asyncio",
+            sample=_core_sample,
+            label="Asyncio ",
+            prefix="asyncio.",
+        )
 
     # ======================
     # BULK OPERATIONS
     # ======================
 
-    def test_bulk_operations(self):
+    @requires_gevent
+    def test_bulk_do_bulk(self):
         """Test bulk operations with multiple endpoints."""
-        from enrichlayer_client.gevent import EnrichLayer, do_bulk
-
-        client = EnrichLayer(api_key=self.api_key)
+        client = self.client
 
         try:
             # Test bulk operation with multiple endpoints using proper syntax
@@ -672,7 +671,7 @@ class TestAllEndpoints(unittest.TestCase):
 
             sample_data = {
                 "total_tasks": len(bulk_operations),
-                "successful_results": len([r for r in result if r.success]),
+                "successful_results": sum(1 for r in result if r.success),
                 "first_result_type": type(result[0]).__name__ if result else None,
             }
 
@@ -684,54 +683,89 @@ class TestAllEndpoints(unittest.TestCase):
             self._record_result("do_bulk", "direct", "error", 0, str(e))
             print(f"⚠️  do_bulk failed: {e}")
 
+    def test_bulk_gather(self):
+        """Test heterogeneous endpoints awaited together with asyncio.gather."""
+        client = self.asyncio_client
+
+        bulk_tests = [
+            (
+                "person.get",
+                lambda: client.person.get(
+                    linkedin_profile_url=self.test_data["person_url"]
+                ),
+                1,
+            ),
+            (
+                "company.get",
+                lambda: client.company.get(url=self.test_data["company_url"]),
+                1,
+            ),
+            (
+                "school.get",
+                lambda: client.school.get(url=self.test_data["school_url"]),
+                1,
+            ),
+        ]
+
+        results = self._gather_async(bulk_tests)
+        for (endpoint_name, _, expected_credits), result in zip(bulk_tests, results):
+            if isinstance(result, Exception):
+                self._record_result(
+                    f"bulk_gather.{endpoint_name}", "asyncio", "error", 0, str(result)
+                )
+                print(f"⚠️  bulk gather {endpoint_name} failed: {result}")
+            else:
+                self._record_result(
+                    f"bulk_gather.{endpoint_name}",
+                    "asyncio",
+                    "success",
+                    expected_credits,
+                )
+
     @classmethod
     def tearDownClass(cls):
         """Generate comprehensive test report after all tests complete."""
-        total_duration = time.time() - cls.start_time
+        total_duration = time.perf_counter() - cls.start_time
+        now = datetime.now()
 
-        # Categorize results
-        by_client_type = {}
-        by_status = {}
-        by_category = {}
+        # Categorize results in a single pass
+        by_client_type = defaultdict(new_counts)
+        by_status = Counter()
+        by_category = defaultdict(new_counts)
+        total_result_duration = 0.0
 
         for result in cls.test_results:
             client_type = result["client_type"]
             status = result["status"]
             endpoint = result["endpoint"]
 
+            # Records carry a raw timestamp, formatted once here
+            result["timestamp"] = datetime.fromtimestamp(
+                result["timestamp"] / 1e9
+            ).isoformat()
+            total_result_duration += result["duration"]
+
             # By client type
-            if client_type not in by_client_type:
-                by_client_type[client_type] = {"total": 0, "success": 0, "error": 0}
             by_client_type[client_type]["total"] += 1
             by_client_type[client_type][status] += 1
 
             # By status
-            if status not in by_status:
-                by_status[status] = 0
             by_status[status] += 1
 
             # By category
-            if "." in endpoint:
-                category = (
-                    endpoint.split(".")[0] if endpoint != "get_balance" else "general"
-                )
-            else:
-                category = "general"
-
-            if category not in by_category:
-                by_category[category] = {"total": 0, "success": 0, "error": 0}
+            category = _endpoint_category(endpoint)
             by_category[category]["total"] += 1
             by_category[category][status] += 1
 
         # Generate comprehensive report
         total_tests = len(cls.test_results)
-        successful_tests = by_status.get("success", 0)
-        failed_tests = by_status.get("error", 0)
+        successful_tests = by_status["success"]
+        failed_tests = by_status["error"]
         success_rate = (successful_tests / total_tests * 100) if total_tests > 0 else 0
 
         report = {
             "test_summary": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "test_type": "comprehensive_endpoint_testing_all_23_endpoints",
                 "total_tests": total_tests,
                 "successful_tests": successful_tests,
@@ -739,75 +773,77 @@ class TestAllEndpoints(unittest.TestCase):
                 "success_rate": f"{success_rate:.1f}%",
                 "total_credits_used": cls.total_credits_used,
                 "total_duration": round(total_duration, 3),
-                "average_response_time": round(
-                    sum(r["duration"] for r in cls.test_results) / total_tests, 3
-                )
+                "average_response_time": round(total_result_duration / total_tests, 3)
                 if total_tests > 0
                 else 0,
             },
-            "by_client_type": by_client_type,
-            "by_category": by_category,
+            "by_client_type": dict(by_client_type),
+            "by_category": dict(by_category),
             "detailed_results": cls.test_results,
         }
 
         # Save detailed JSON report
         with open("tests/comprehensive_endpoint_test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+            f.write(dumps(report))
+
+        # Build the human-readable summary in memory, then write it once
+        parts = []
+        append = parts.append
+        append("CONSOLIDATED ENDPOINT TEST RESULTS\n")
+        append("=" * 70 + "\n")
+        append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append("=" * 70 + "\n\n")
+
+        append("📊 OVERALL SUMMARY\n")
+        append("-" * 30 + "\n")
+        append(f"Total Tests: {total_tests}\n")
+        append(f"Successful: {successful_tests}\n")
+        append(f"Failed: {failed_tests}\n")
+        append(f"Success Rate: {success_rate:.1f}%\n")
+        append(f"Total Credits Used: {cls.total_credits_used}\n")
+        append(f"Duration: {total_duration:.2f}s\n\n")
+
+        append("📊 BY CLIENT TYPE\n")
+        append("-" * 30 + "\n")
+        parts.extend(
+            f"{client_type.upper()}: {stats['success']}/{stats['total']} successful ({stats['success'] / stats['total'] * 100:.1f}%)\n"
+            for client_type, stats in by_client_type.items()
+        )
+        append("\n")
 
-        # Save human-readable summary
-        with open("tests/endpoint_test_summary.txt", "w") as f:
-            f.write("CONSOLIDATED ENDPOINT TEST RESULTS\n")
-            f.write("=" * 70 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 70 + "\n\n")
-
-            f.write("📊 OVERALL SUMMARY\n")
-            f.write("-" * 30 + "\n")
-            f.write(f"Total Tests: {total_tests}\n")
-            f.write(f"Successful: {successful_tests}\n")
-            f.write(f"Failed: {failed_tests}\n")
-            f.write(f"Success Rate: {success_rate:.1f}%\n")
-            f.write(f"Total Credits Used: {cls.total_credits_used}\n")
-            f.write(f"Duration: {total_duration:.2f}s\n\n")
-
-            f.write("📊 BY CLIENT TYPE\n")
-            f.write("-" * 30 + "\n")
-            for client_type, stats in by_client_type.items():
-                f.write(
-                    f"{client_type.upper()}: {stats['success']}/{stats['total']} successful ({stats['success'] / stats['total'] * 100:.1f}%)\n"
-                )
-            f.write("\n")
+        append("📊 BY CATEGORY\n")
+        append("-" * 30 + "\n")
+        parts.extend(
+            f"{category.upper()}: {stats['success']}/{stats['total']} successful ({stats['success'] / stats['total'] * 100:.1f}%)\n"
+            for category, stats in by_category.items()
+        )
+        append("\n")
+
+        append("✅ SUCCESSFUL ENDPOINTS\n")
+        append("-" * 30 + "\n")
+        parts.extend(
+            f"  ✅ {result['endpoint']} ({result['client_type']}) - {result['credits_used']} credits, {result['duration']}s\n"
+            for result in cls.test_results
+            if result["status"] == "success"
+        )
+        append("\n")
+
+        if failed_tests > 0:
+            append("❌ FAILED ENDPOINTS\n")
+            append("-" * 30 + "\n")
+            parts.extend(
+                f"  ❌ {result['endpoint']} ({result['client_type']}) - {result.get('error', 'Unknown error')}\n"
+                for result in cls.test_results
+                if result["status"] == "error"
+            )
+            append("\n")
 
-            f.write("📊 BY CATEGORY\n")
-            f.write("-" * 30 + "\n")
-            for category, stats in by_category.items():
-                f.write(
-                    f"{category.upper()}: {stats['success']}/{stats['total']} successful ({stats['success'] / stats['total'] * 100:.1f}%)\n"
-                )
-            f.write("\n")
-
-            f.write("✅ SUCCESSFUL ENDPOINTS\n")
-            f.write("-" * 30 + "\n")
-            for result in cls.test_results:
-                if result["status"] == "success":
-                    f.write(
-                        f"  ✅ {result['endpoint']} ({result['client_type']}) - {result['credits_used']} credits, {result['duration']}s\n"
-                    )
-            f.write("\n")
-
-            if failed_tests > 0:
-                f.write("❌ FAILED ENDPOINTS\n")
-                f.write("-" * 30 + "\n")
-                for result in cls.test_results:
-                    if result["status"] == "error":
-                        f.write(
-                            f"  ❌ {result['endpoint']} ({result['client_type']}) - {result.get('error', 'Unknown error')}\n"
-                        )
-                f.write("\n")
+        with open("tests/endpoint_test_summary.txt", "w") as f:
+            f.write("".join(parts))
 
         # Save executive summary
         executive_summary = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "test_framework": "unittest_consolidated",
             "total_tests": total_tests,
             "successful_tests": successful_tests,
@@ -819,7 +855,7 @@ class TestAllEndpoints(unittest.TestCase):
         }
 
         with open("tests/executive_summary.json", "w") as f:
-            json.dump(executive_summary, f, indent=2)
+            f.write(dumps(executive_summary))
 
         # Print summary
         print(f"\n{'=' * 70}")
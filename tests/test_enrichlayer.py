@@ -5,12 +5,18 @@ Core EnrichLayer library tests.
 Tests basic functionality, configuration, and client initialization.
 """
 
+import importlib
 import os
 import sys
 import unittest
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Client variants and whether each one is an optional extra (asyncio is required)
+VARIANTS = (("asyncio", False), ("gevent", True), ("twisted", True))
 
 
 class TestEnrichLayerCore(unittest.TestCase):
@@ -27,29 +33,18 @@ class TestEnrichLayerCore(unittest.TestCase):
             # If no __version__ defined, that's ok for now
             pass
 
-    def test_asyncio_client_import(self):
-        """Test that asyncio client can be imported."""
-        from enrichlayer_client.asyncio import EnrichLayer
-
-        self.assertTrue(callable(EnrichLayer))
-
-    def test_gevent_client_import(self):
-        """Test that gevent client can be imported."""
-        try:
-            from enrichlayer_client.gevent import EnrichLayer
-
-            self.assertTrue(callable(EnrichLayer))
-        except ImportError:
-            self.skipTest("Gevent not available")
-
-    def test_twisted_client_import(self):
-        """Test that twisted client can be imported."""
-        try:
-            from enrichlayer_client.twisted import EnrichLayer
-
-            self.assertTrue(callable(EnrichLayer))
-        except ImportError:
-            self.skipTest("Twisted not available")
+    def test_client_imports(self):
+        """Test that every client variant can be imported."""
+        for variant, optional in VARIANTS:
+            with self.subTest(variant=variant):
+                try:
+                    module = importlib.import_module(f"enrichlayer_client.{variant}")
+                except ImportError:
+                    if not optional:
+                        raise
+                    self.skipTest(f"{variant.capitalize()} not available")
+
+                self.assertTrue(callable(module.EnrichLayer))
 
     def test_client_initialization(self):
         """Test that clients can be initialized."""
@@ -6,12 +6,36 @@ Consolidates exception mapping tests from multiple root-level test files.
 Tests static mapping, variant consistency, and security features.
 """
 
+import asyncio
+from collections.abc import Mapping
+import importlib
 import os
 import sys
 import unittest
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from proxycurl.asyncio.base import ProxycurlException  # noqa: E402
+
+from enrichlayer_client.asyncio.base import EnrichLayerException  # noqa: E402
+from enrichlayer_client.compat.monkey_patch import (  # noqa: E402
+    AVAILABLE_ENRICHLAYER_VARIANTS,
+    AVAILABLE_PROXYCURL_VARIANTS,
+    EXCEPTION_CLASS_MAPPING,
+    VARIANTS,
+    error_mapping_decorator,
+)
+
+# (variant, module defining EnrichLayerException, module defining the expected
+# ProxycurlException)
+_MAPPING_CASES = (
+    ("asyncio", "enrichlayer_client.asyncio.base", "proxycurl.asyncio.base"),
+    ("gevent", "enrichlayer_client.gevent.base", "proxycurl.gevent.base"),
+    ("twisted", "enrichlayer_client.twisted.base", "proxycurl.twisted.base"),
+)
 
 
 class TestExceptionMapping(unittest.TestCase):
@@ -19,74 +43,67 @@ class TestExceptionMapping(unittest.TestCase):
 
     def test_variant_specific_mapping(self):
         """Test that each variant maps to its corresponding proxycurl exception."""
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
 
-        # Test asyncio mapping
         @error_mapping_decorator
-        def test_asyncio_exception():
-            from enrichlayer_client.asyncio.base import EnrichLayerException
+        def raise_exception(exception_class, message):
+            raise exception_class(message)
 
-            raise EnrichLayerException("Test asyncio error")
+        for variant, module_name, expected_module in _MAPPING_CASES:
+            with self.subTest(variant=variant):
+                exception_class = importlib.import_module(
+                    module_name
+                ).EnrichLayerException
+                expected_class = importlib.import_module(
+                    expected_module
+                ).ProxycurlException
 
-        with self.assertRaises(Exception) as cm:
-            test_asyncio_exception()
-
-        # Should be mapped to proxycurl.asyncio.base.ProxycurlException
-        self.assertIn("proxycurl.asyncio", cm.exception.__class__.__module__)
-        self.assertEqual(cm.exception.__class__.__name__, "ProxycurlException")
+                with self.assertRaises(Exception) as cm:
+                    raise_exception(exception_class, f"Test {variant} error")
 
-        # Test gevent mapping
-        @error_mapping_decorator
-        def test_gevent_exception():
-            from enrichlayer_client.gevent.base import EnrichLayerException
+                # Should be mapped to proxycurl.<variant>.base.ProxycurlException
+                self.assertIs(type(cm.exception), expected_class)
 
-            raise EnrichLayerException("Test gevent error")
-
-        with self.assertRaises(Exception) as cm:
-            test_gevent_exception()
-
-        # Should be mapped to proxycurl.gevent.base.ProxycurlException
-        self.assertIn("proxycurl.gevent", cm.exception.__class__.__module__)
-        self.assertEqual(cm.exception.__class__.__name__, "ProxycurlException")
+    def test_static_mapping_efficiency(self):
+        """Test that static mapping is used instead of dynamic imports."""
+        # Verify mapping is populated at module level
+        self.assertIsInstance(EXCEPTION_CLASS_MAPPING, Mapping)
+        self.assertGreater(len(EXCEPTION_CLASS_MAPPING), 0)
 
-        # Test twisted mapping
-        @error_mapping_decorator
-        def test_twisted_exception():
-            from enrichlayer_client.twisted.base import EnrichLayerException
+        # The mapping is a read-only view
+        with self.assertRaises(TypeError):
+            EXCEPTION_CLASS_MAPPING["enrichlayer_client.asyncio"] = None  # type: ignore
 
-            raise EnrichLayerException("Test twisted error")
+        # Verify static mapping entries for every installed proxycurl variant
+        for variant, _, proxycurl_module in _MAPPING_CASES:
+            with self.subTest(variant=variant):
+                try:
+                    expected_class = importlib.import_module(
+                        proxycurl_module
+                    ).ProxycurlException
+                except ImportError:
+                    self.skipTest(f"{proxycurl_module} not installed")
 
-        with self.assertRaises(Exception) as cm:
-            test_twisted_exception()
+                mapping = f"enrichlayer_client.{variant}"
+                self.assertIn(mapping, EXCEPTION_CLASS_MAPPING)
+                self.assertIs(EXCEPTION_CLASS_MAPPING[mapping], expected_class)
 
-        # Should be mapped to proxycurl.twisted.base.ProxycurlException
-        self.assertIn("proxycurl.twisted", cm.exception.__class__.__module__)
-        self.assertEqual(cm.exception.__class__.__name__, "ProxycurlException")
+    def test_subclass_mapping(self):
+        """Test that EnrichLayerException subclasses map to their variant."""
 
-    def test_static_mapping_efficiency(self):
-        """Test that static mapping is used instead of dynamic imports."""
-        from enrichlayer_client.compat.monkey_patch import EXCEPTION_CLASS_MAPPING
+        class CustomEnrichLayerException(EnrichLayerException):
+            pass
 
-        # Verify mapping is populated at module level
-        self.assertIsInstance(EXCEPTION_CLASS_MAPPING, dict)
-        self.assertGreater(len(EXCEPTION_CLASS_MAPPING), 0)
+        @error_mapping_decorator
+        def test_subclass_exception():
+            raise CustomEnrichLayerException("Subclass error")
 
-        # Verify static mapping entries
-        expected_mappings = [
-            "enrichlayer_client.asyncio",
-            "enrichlayer_client.gevent",
-            "enrichlayer_client.twisted",
-        ]
+        with self.assertRaises(Exception) as cm:
+            test_subclass_exception()
 
-        for mapping in expected_mappings:
-            if mapping in EXCEPTION_CLASS_MAPPING:
-                exception_class = EXCEPTION_CLASS_MAPPING[mapping]
-                self.assertTrue(hasattr(exception_class, "__name__"))
-                self.assertEqual(exception_class.__name__, "ProxycurlException")
+        self.assertIs(type(cm.exception), ProxycurlException)
 
     def test_no_fallback_behavior(self):
         """Test that unmapped exceptions are raised as-is without fallback."""
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
 
         # Test with non-enrichlayer exception
         @error_mapping_decorator
@@ -102,7 +119,6 @@ class TestExceptionMapping(unittest.TestCase):
 
     def test_name_spoofing_resistance(self):
         """Test that fake exceptions with EnrichLayerException name are rejected."""
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
 
         # Create fake exception with same name but different class
         class FakeEnrichLayerException(Exception):
@@ -125,14 +141,10 @@ class TestExceptionMapping(unittest.TestCase):
 
     def test_exception_message_preservation(self):
         """Test that original exception messages are preserved in mapping."""
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
-
         original_message = "Original error message with details"
 
         @error_mapping_decorator
         def test_message_preservation():
-            from enrichlayer_client.asyncio.base import EnrichLayerException
-
             raise EnrichLayerException(original_message)
 
         with self.assertRaises(Exception) as cm:
@@ -141,16 +153,13 @@ class TestExceptionMapping(unittest.TestCase):
         # Message should be preserved
         self.assertEqual(str(cm.exception), original_message)
         # But class should be mapped
-        self.assertIn("proxycurl.asyncio", cm.exception.__class__.__module__)
+        self.assertIs(type(cm.exception), ProxycurlException)
 
     def test_exception_chaining(self):
         """Test that exception chaining is preserved."""
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
 
         @error_mapping_decorator
         def test_exception_chaining():
-            from enrichlayer_client.asyncio.base import EnrichLayerException
-
             raise EnrichLayerException("Mapped exception")
 
         with self.assertRaises(Exception) as cm:
@@ -162,29 +171,39 @@ class TestExceptionMapping(unittest.TestCase):
             cm.exception.__cause__.__class__.__name__, "EnrichLayerException"
         )
 
+    def test_nested_decorator_passthrough(self):
+        """Test that an already mapped exception is not mapped again."""
+
+        @error_mapping_decorator
+        def inner():
+            raise EnrichLayerException("Inner error")
+
+        @error_mapping_decorator
+        def outer():
+            inner()
+
+        with self.assertRaises(ProxycurlException) as cm:
+            outer()
+
+        # The outer wrapper re-raises the inner mapping unchanged
+        self.assertIs(type(cm.exception.__cause__), EnrichLayerException)
+
     def test_async_and_sync_decorator_compatibility(self):
         """Test that decorator works with both async and sync functions."""
-        import asyncio
-
-        from enrichlayer_client.compat.monkey_patch import error_mapping_decorator
 
         # Test sync function
         @error_mapping_decorator
         def sync_function():
-            from enrichlayer_client.asyncio.base import EnrichLayerException
-
             raise EnrichLayerException("Sync error")
 
         with self.assertRaises(Exception) as cm:
             sync_function()
 
-        self.assertIn("proxycurl.asyncio", cm.exception.__class__.__module__)
+        self.assertIs(type(cm.exception), ProxycurlException)
 
         # Test async function
         @error_mapping_decorator
         async def async_function():
-            from enrichlayer_client.asyncio.base import EnrichLayerException
-
             raise EnrichLayerException("Async error")
 
         async def run_async_test():
@@ -193,30 +212,18 @@ class TestExceptionMapping(unittest.TestCase):
             return cm.exception
 
         # Run async test
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            exception = loop.run_until_complete(run_async_test())
-            self.assertIn("proxycurl.asyncio", exception.__class__.__module__)
-        finally:
-            loop.close()
+        exception = asyncio.run(run_async_test())
+        self.assertIs(type(exception), ProxycurlException)
 
     def test_module_level_initialization(self):
         """Test that exception mapping is initialized at module level."""
-        from enrichlayer_client.compat.monkey_patch import (
-            AVAILABLE_ENRICHLAYER_VARIANTS,
-            AVAILABLE_PROXYCURL_VARIANTS,
-            EXCEPTION_CLASS_MAPPING,
-            VARIANTS,
-        )
-
         # Verify constants are defined
         self.assertEqual(VARIANTS, ["asyncio", "gevent", "twisted"])
 
         # Verify dictionaries are populated
         self.assertIsInstance(AVAILABLE_PROXYCURL_VARIANTS, dict)
         self.assertIsInstance(AVAILABLE_ENRICHLAYER_VARIANTS, dict)
-        self.assertIsInstance(EXCEPTION_CLASS_MAPPING, dict)
+        self.assertIsInstance(EXCEPTION_CLASS_MAPPING, Mapping)
 
         # Should have at least asyncio available (required dependency)
         self.assertIn("asyncio", AVAILABLE_PROXYCURL_VARIANTS)